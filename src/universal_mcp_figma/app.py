@@ -1,11 +1,337 @@
+import atexit
+import collections
+import contextlib
+import contextvars
+import functools
+import glob
+import hashlib
+import itertools
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any
+
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+from universal_mcp_figma.cache import TTLCache
+from universal_mcp_figma.dev_resources import (
+    DEV_RESOURCES_BATCH_SIZE,
+    chunked,
+    diff_dev_resources,
+)
+from universal_mcp_figma.latency import (
+    DEFAULT_ENDPOINT_TIMEOUTS,
+    DEFAULT_HEDGED_ENDPOINTS,
+    LatencyTracker,
+    deadline,
+    endpoint_template,
+    remaining_time,
+)
+from universal_mcp_figma.parallel import PARALLEL_TASKS, create_pool, process_document
+from universal_mcp_figma.profiling import ToolProfiler
+from universal_mcp_figma.snapshot import Snapshot, write_snapshot
+from universal_mcp_figma.spatial import PageIndex, build_page_indexes
+from universal_mcp_figma.text import iter_text_batches
+from universal_mcp_figma.usage import ComponentUsageGraph, scan_component_usages
+from universal_mcp_figma.variables import (
+    MAX_VARIABLES_REQUEST_BYTES,
+    VariableChangePlanner,
+    VariableResolver,
+    pack_variable_batches,
+    replace_temp_ids,
+)
+from universal_mcp_figma.vectors import node_to_svg
+from universal_mcp_figma.warmup import AccessFrequencyTable, WarmupScheduler
+
+# Rendered image URLs expire after 30 days; stop serving them a day earlier.
+IMAGE_URL_TTL = 29 * 24 * 60 * 60
+# How long the current version of a file is trusted when keying image renders.
+FILE_VERSION_TTL = 30
+# Node IDs requested per GET /v1/files/{file_key}/nodes call when exporting vectors.
+VECTOR_EXPORT_BATCH_SIZE = 100
+# Text hashes remembered as indexed by extract_text_content; older ones are sent again.
+TEXT_HASHES_MAX = 200_000
+# Responses that the warmup scheduler keeps cached for the hottest files.
+WARMED_ENDPOINTS = ("get_file", "get_file_components", "get_file_styles")
+
+_prefetching = contextvars.ContextVar("figma_prefetching", default=False)
+# The tool being served; the response cache is only used by the tool of its endpoint.
+_current_tool = contextvars.ContextVar("figma_current_tool", default=None)
+
+
 class FigmaApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    def __init__(self, integration: Integration = None, cache_dir: str | None = None, image_cache_ttl: float = IMAGE_URL_TTL, timeouts: dict[str, float] | None = None, hedged_endpoints=None, hedge_budget: float = 0.1, tool_deadlines: dict[str, float] | None = None, profile_tools=None, profile_threshold: float | None = None, profile_interval: float = 0.01, response_cache_ttl: float = 0, response_cache_bytes: int = 256 * 1024 * 1024, warmup: bool = False, warmup_top_n: int = 20, warmup_budget: int = 50, warmup_interval: float = 10 * 60, tenant_id: str | None = None, rate_limit=None, shared_cache=None, analysis_workers: int | None = None, **kwargs) -> None:
         super().__init__(name='figma', integration=integration, **kwargs)
         self.base_url = "https://api.figma.com"
+        self.cache_dir = cache_dir or os.environ.get("FIGMA_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "universal_mcp_figma")
+        if tenant_id is not None:
+            # Snapshots, usage graphs and access tables hold data only the tenant may read.
+            self.cache_dir = os.path.join(self.cache_dir, "tenants", hashlib.sha256(tenant_id.encode("utf-8")).hexdigest()[:32])
+        self.timeouts = {**DEFAULT_ENDPOINT_TIMEOUTS, **(timeouts or {})}
+        # Hedging is opt-in; True hedges the endpoints known for heavy tail latency.
+        self.hedged_endpoints = DEFAULT_HEDGED_ENDPOINTS if hedged_endpoints is True else frozenset(hedged_endpoints or ())
+        self.hedge_budget = hedge_budget
+        self.tool_deadlines = tool_deadlines or {}
+        self._latency = LatencyTracker()
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._request_counts = {"requests": 0, "hedged": 0, "hedge_wins": 0}
+        self.tenant_id = tenant_id
+        self.rate_limit = rate_limit
+        self.shared_cache = shared_cache
+        self._response_cache = TTLCache(ttl=response_cache_ttl, max_entries=256, max_bytes=response_cache_bytes) if response_cache_ttl else None
+        self.access_frequency = AccessFrequencyTable(os.path.join(self.cache_dir, "access_frequency.json"))
+        self.warmup = None
+        if warmup and self._response_cache is not None:
+            self.warmup = WarmupScheduler(self.access_frequency, self._prefetch, self._needs_refresh, top_n=warmup_top_n, budget=warmup_budget, interval=warmup_interval)
+            self.warmup.start()
+            atexit.register(self.warmup.stop)
+        self.profiler = None
+        if profile_tools or profile_threshold is not None:
+            self.profiler = ToolProfiler(os.path.join(self.cache_dir, "profiles"), tools=profile_tools, threshold=profile_threshold, interval=profile_interval)
+        self.analysis_workers = analysis_workers or os.cpu_count() or 1
+        self._process_pool = None
+        self._snapshots: dict[str, Snapshot] = {}
+        self._image_cache = TTLCache(ttl=image_cache_ttl, max_entries=100_000) if image_cache_ttl else None
+        self._file_versions = TTLCache(ttl=FILE_VERSION_TTL)
+        self._spatial_indexes = TTLCache(ttl=60 * 60, max_entries=16)
+        self._vector_exports = TTLCache(ttl=24 * 60 * 60, max_entries=10_000)
+        self._component_usage: ComponentUsageGraph | None = None
+        self._variable_resolvers: dict[str, VariableResolver] = {}
+        self._text_versions: dict[str, str] = {}
+        self._text_hashes = TTLCache(ttl=30 * 24 * 60 * 60, max_entries=TEXT_HASHES_MAX)
+        self._text_cursors = TTLCache(ttl=10 * 60, max_entries=64)
+
+    def _request_timeout(self, endpoint) -> float | None:
+        timeout = self.timeouts.get(endpoint)
+        remaining = remaining_time()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise TimeoutError(f"Deadline exceeded before requesting {endpoint}")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def _timed_request(self, method, endpoint, url, params=None, data=None, timeout=None):
+        kwargs = {"params": params}
+        if data is not None:
+            kwargs["json"] = data
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        start = time.monotonic()
+        if remaining_time() is None:
+            response = self.client.request(method, url, **kwargs)
+        else:
+            response = self._request_before_deadline(method, endpoint, url, kwargs)
+        if method == "GET":
+            self._latency.record(endpoint, time.monotonic() - start)
+        return response
+
+    def _request_before_deadline(self, method, endpoint, url, kwargs):
+        # httpx applies a timeout to each connect, read and write on its own, so
+        # a body that keeps trickling in could outlast the deadline. The body is
+        # read in chunks instead and abandoned once the deadline has passed.
+        request = self.client.build_request(method, url, **kwargs)
+        response = self.client.send(request, stream=True)
+        chunks = []
+        try:
+            for chunk in response.iter_raw():
+                if remaining_time() <= 0:
+                    raise TimeoutError(f"Deadline exceeded while reading the response of {endpoint}")
+                chunks.append(chunk)
+        finally:
+            response.close()
+        return httpx.Response(response.status_code, headers=response.headers, content=b"".join(chunks), request=request)
+
+    def _acquire_budget(self) -> None:
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+
+    def _send(self, method, url, params=None, data=None):
+        endpoint = endpoint_template(url)
+        timeout = self._request_timeout(endpoint)
+        self._acquire_budget()
+        self._request_counts["requests"] += 1
+        if method == "GET" and endpoint in self.hedged_endpoints:
+            return self._hedged_get(endpoint, url, params, timeout)
+        return self._timed_request(method, endpoint, url, params, data, timeout)
+
+    # Every request goes through _send, so timeouts, deadlines and the rate
+    # limit apply alike to reads and writes.
+    def _get(self, url, params=None):
+        return self._send("GET", url, params=params)
+
+    def _post(self, url, data, params=None):
+        return self._send("POST", url, params=params, data=data)
+
+    def _put(self, url, data, params=None):
+        return self._send("PUT", url, params=params, data=data)
+
+    def _delete(self, url, params=None):
+        return self._send("DELETE", url, params=params)
+
+    def _hedged_get(self, endpoint, url, params, timeout):
+        # A duplicate request goes out once the primary is slower than the
+        # endpoint's p95, as long as hedges stay within the budget of extra load.
+        delay = self._latency.percentile(endpoint, 0.95)
+        within_budget = self._request_counts["hedged"] < self.hedge_budget * self._request_counts["requests"]
+        if delay is None or not within_budget:
+            return self._timed_request("GET", endpoint, url, params, timeout=timeout)
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="figma-hedge")
+        context = contextvars.copy_context()
+        primary = self._hedge_executor.submit(context.run, self._timed_request, "GET", endpoint, url, params, None, timeout)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        # The duplicate is a request of its own and takes from the rate limit too.
+        self._acquire_budget()
+        self._request_counts["hedged"] += 1
+        hedge = self._hedge_executor.submit(context.copy().run, self._timed_request, "GET", endpoint, url, params, None, timeout)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # The first response that is neither an error nor a server error wins.
+                if future.exception() is None and future.result().status_code < 500:
+                    if future is hedge:
+                        self._request_counts["hedge_wins"] += 1
+                    return future.result()
+        return primary.result()
+
+    def get_request_latency_stats(self) -> dict[str, Any]:
+        """
+        Reports recent request latency percentiles per endpoint, the configured timeouts and how often hedged requests were sent and won.
+
+        Returns:
+            dict[str, Any]: The p50, p95 and p99 latency per endpoint in seconds, the per-endpoint timeouts, the hedged endpoints and the request, hedge and hedge win counts.
+
+        Tags:
+            Diagnostics
+        """
+        return {
+            "endpoints": self._latency.stats(),
+            "timeouts": self.timeouts,
+            "hedged_endpoints": sorted(self.hedged_endpoints),
+            **self._request_counts,
+        }
+
+    def get_tool_profiles(self) -> dict[str, Any]:
+        """
+        Lists the most recent tool call profiles with the time spent on requests, response decoding and other work, an estimate of the result serialization time, and the speedscope files holding their flamegraphs.
+
+        Returns:
+            dict[str, Any]: Whether profiling is enabled and, per kept profile, the tool, duration, sample count, time per phase in seconds and the path of its speedscope file. The serialize phase is estimated by encoding the result once more as JSON, since the server encodes it after the call, and is null when the result cannot be encoded that way.
+
+        Tags:
+            Diagnostics
+        """
+        if self.profiler is None:
+            return {"enabled": False, "profiles": []}
+        return {"enabled": True, "profiles": list(self.profiler.profiles)}
+
+    def _shared_response(self, endpoint, file_key, query_params):
+        if self.shared_cache is None or query_params.get('version') is None:
+            return None
+        key = (endpoint, file_key, tuple(sorted(query_params.items())))
+
+        def verify_access():
+            response = self._get(f"{self.base_url}/v1/files/{file_key}", params={'version': query_params['version'], 'depth': 1})
+            response.raise_for_status()
+
+        return self.shared_cache.get(self.tenant_id, file_key, key, verify_access)
+
+    def _share_response(self, endpoint, file_key, query_params, result, size) -> None:
+        if self.shared_cache is not None and query_params.get('version') is not None:
+            key = (endpoint, file_key, tuple(sorted(query_params.items())))
+            self.shared_cache.set(self.tenant_id, file_key, key, result, size=size)
+
+    def close(self) -> None:
+        """Releases the client, background threads and snapshots held by this app."""
+        if self.warmup is not None:
+            self.warmup.stop()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        for snapshot in self._snapshots.values():
+            snapshot.close()
+        self._snapshots.clear()
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
+    # Tools that fetch the same data internally, e.g. to detect changes, always
+    # get a fresh response and are not counted as accesses of the endpoint.
+    def _cached_response(self, endpoint, file_key, cache_key):
+        if _current_tool.get() != endpoint or _prefetching.get():
+            return None
+        self.access_frequency.record(endpoint, file_key)
+        if self._response_cache is None:
+            return None
+        return self._response_cache.get(cache_key)
+
+    def _cache_response(self, cache_key, result, size=0) -> None:
+        # Entries are weighed by the size of their JSON response body.
+        if self._response_cache is not None and _current_tool.get() == cache_key[0]:
+            self._response_cache.set(cache_key, result, size=size)
+
+    def _needs_refresh(self, endpoint, file_key) -> bool:
+        # Entries are refreshed ahead of expiry so the next run still finds them warm.
+        interval = self.warmup.interval if self.warmup is not None else 0
+        return self._response_cache.remaining((endpoint, file_key)) <= interval
+
+    def _prefetch(self, endpoint, file_key):
+        if endpoint not in WARMED_ENDPOINTS:
+            raise ValueError(f"Endpoint '{endpoint}' cannot be prefetched")
+        prefetching, tool = _prefetching.set(True), _current_tool.set(endpoint)
+        try:
+            return getattr(self, endpoint)(file_key)
+        finally:
+            _current_tool.reset(tool)
+            _prefetching.reset(prefetching)
+
+    def get_warmup_status(self) -> dict[str, Any]:
+        """
+        Reports the hottest files by decayed access frequency and the state of the background scheduler that prefetches them into the response cache.
+
+        Returns:
+            dict[str, Any]: Whether the response cache and warmup scheduler are enabled, the scheduler's run and prefetch counts, the cache statistics and the hottest endpoint and file key pairs with their scores.
+
+        Tags:
+            Diagnostics
+        """
+        return {
+            "response_cache": self._response_cache.stats() if self._response_cache is not None else None,
+            "warmup_enabled": self.warmup is not None,
+            "runs": self.warmup.runs if self.warmup is not None else 0,
+            "prefetched": self.warmup.prefetched if self.warmup is not None else 0,
+            "hottest": [
+                {"endpoint": endpoint, "file_key": file_key, "score": score}
+                for endpoint, file_key, score in self.access_frequency.top(self.warmup.top_n if self.warmup is not None else 20)
+            ],
+        }
+
+    def _wrap_tool(self, tool):
+        name = tool.__name__
+        seconds = self.tool_deadlines.get(name)
+        profiled = self.profiler is not None and self.profiler.selects(name)
+
+        @functools.wraps(tool)
+        def wrapper(*args, **kwargs):
+            token = _current_tool.set(name)
+            try:
+                with deadline(seconds) if seconds is not None else contextlib.nullcontext():
+                    if profiled:
+                        return self.profiler.call(name, tool, *args, **kwargs)
+                    return tool(*args, **kwargs)
+            finally:
+                _current_tool.reset(token)
+
+        return wrapper
 
     def get_file(self, file_key, version=None, ids=None, depth=None, geometry=None, plugin_data=None, branch_data=None) -> dict[str, Any]:
         """
@@ -30,9 +356,22 @@ class FigmaApp(APIApplication):
             raise ValueError("Missing required parameter 'file_key'")
         url = f"{self.base_url}/v1/files/{file_key}"
         query_params = {k: v for k, v in [('version', version), ('ids', ids), ('depth', depth), ('geometry', geometry), ('plugin_data', plugin_data), ('branch_data', branch_data)] if v is not None}
+        # Only whole-file requests are cached, so depth=1 version probes always see the latest version.
+        cacheable = not query_params
+        if cacheable:
+            cached = self._cached_response('get_file', file_key, ('get_file', file_key))
+        else:
+            cached = self._shared_response('get_file', file_key, query_params)
+        if cached is not None:
+            return cached
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        if cacheable:
+            self._cache_response(('get_file', file_key), result, size=len(response.content))
+        else:
+            self._share_response('get_file', file_key, query_params, result, size=len(response.content))
+        return result
 
     def get_file_nodes(self, file_key, ids, version=None, depth=None, geometry=None, plugin_data=None) -> dict[str, Any]:
         """
@@ -56,14 +395,21 @@ class FigmaApp(APIApplication):
             raise ValueError("Missing required parameter 'file_key'")
         url = f"{self.base_url}/v1/files/{file_key}/nodes"
         query_params = {k: v for k, v in [('ids', ids), ('version', version), ('depth', depth), ('geometry', geometry), ('plugin_data', plugin_data)] if v is not None}
+        cached = self._shared_response('get_file_nodes', file_key, query_params)
+        if cached is not None:
+            return cached
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        self._share_response('get_file_nodes', file_key, query_params, result, size=len(response.content))
+        return result
 
     def get_images(self, file_key, ids, version=None, scale=None, format=None, svg_outline_text=None, svg_include_id=None, svg_include_node_id=None, svg_simplify_stroke=None, contents_only=None, use_absolute_bounds=None) -> dict[str, Any]:
         """
         Retrieves an image specified by the `file_key` using the GET method, allowing optional query parameters for customization such as formatting, scaling, and SVG options.
 
+        Rendered image URLs are cached per file version, node and render options until shortly before they expire, and only nodes without a cached URL are sent to the API.
+
         Args:
             file_key (string): file_key
             ids (string): A comma separated list of node IDs to render.
@@ -86,10 +432,80 @@ class FigmaApp(APIApplication):
         if file_key is None:
             raise ValueError("Missing required parameter 'file_key'")
         url = f"{self.base_url}/v1/images/{file_key}"
-        query_params = {k: v for k, v in [('ids', ids), ('version', version), ('scale', scale), ('format', format), ('svg_outline_text', svg_outline_text), ('svg_include_id', svg_include_id), ('svg_include_node_id', svg_include_node_id), ('svg_simplify_stroke', svg_simplify_stroke), ('contents_only', contents_only), ('use_absolute_bounds', use_absolute_bounds)] if v is not None}
+        if self._image_cache is None:
+            query_params = {k: v for k, v in [('ids', ids), ('version', version), ('scale', scale), ('format', format), ('svg_outline_text', svg_outline_text), ('svg_include_id', svg_include_id), ('svg_include_node_id', svg_include_node_id), ('svg_simplify_stroke', svg_simplify_stroke), ('contents_only', contents_only), ('use_absolute_bounds', use_absolute_bounds)] if v is not None}
+            response = self._get(url, params=query_params)
+            response.raise_for_status()
+            return response.json()
+        version = self._resolved_version(file_key, version)
+        render_params = (scale, format, svg_outline_text, svg_include_id, svg_include_node_id, svg_simplify_stroke, contents_only, use_absolute_bounds)
+        node_ids = [node_id.strip() for node_id in ids.split(",") if node_id.strip()] if isinstance(ids, str) else list(ids)
+        images = {node_id: self._image_cache.get((file_key, version, node_id, *render_params)) for node_id in node_ids}
+        missing = [node_id for node_id, image_url in images.items() if image_url is None]
+        if not missing:
+            return {"err": None, "images": images, "status": 200}
+        query_params = {k: v for k, v in [('ids', ",".join(missing)), ('version', version), ('scale', scale), ('format', format), ('svg_outline_text', svg_outline_text), ('svg_include_id', svg_include_id), ('svg_include_node_id', svg_include_node_id), ('svg_simplify_stroke', svg_simplify_stroke), ('contents_only', contents_only), ('use_absolute_bounds', use_absolute_bounds)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        for node_id, image_url in (result.get("images") or {}).items():
+            # Failed renders come back as null and are retried on the next call.
+            if image_url is not None:
+                self._image_cache.set((file_key, version, node_id, *render_params), image_url)
+            images[node_id] = image_url
+        return {**result, "images": images}
+
+    def get_image_cache_stats(self) -> dict[str, Any]:
+        """
+        Reports how many rendered image URLs are cached for `get_images` and the share of node renders served from the cache.
+
+        Returns:
+            dict[str, Any]: The number of cached entries, hits, misses and the hit ratio.
+
+        Tags:
+            Files
+        """
+        if self._image_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._image_cache.stats()}
+
+    def export_vectors(self, file_key, ids, version=None, precision=2) -> dict[str, Any]:
+        """
+        Exports nodes as SVG documents built locally from their vector path geometry, without rendering them through the images endpoint, caching each export per file version.
+
+        Args:
+            file_key (string): file_key
+            ids (string): A comma separated list of node IDs to export, such as the icons of an icon set.
+            version (string): A specific version ID to get. Omitting this will get the current version of the file.
+            precision (number): The number of decimals kept for path coordinates. Default: 2.
+
+        Returns:
+            dict[str, Any]: The file version, the SVG markup per node ID, and the IDs that could not be found.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if ids is None:
+            raise ValueError("Missing required parameter 'ids'")
+        version = self._resolved_version(file_key, version)
+        node_ids = [node_id.strip() for node_id in ids.split(",") if node_id.strip()] if isinstance(ids, str) else list(ids)
+        svgs = {node_id: self._vector_exports.get((file_key, version, node_id, precision)) for node_id in node_ids}
+        missing = [node_id for node_id, svg in svgs.items() if svg is None]
+        not_found = []
+        # Large icon sets are fetched in chunks to stay within URL and response size limits.
+        for batch in chunked(missing, VECTOR_EXPORT_BATCH_SIZE):
+            nodes = self.get_file_nodes(file_key, ",".join(batch), version=version, geometry="paths").get("nodes") or {}
+            for node_id in batch:
+                document = (nodes.get(node_id) or {}).get("document")
+                if document is None:
+                    not_found.append(node_id)
+                    del svgs[node_id]
+                    continue
+                svgs[node_id] = node_to_svg(document, precision=precision)
+                self._vector_exports.set((file_key, version, node_id, precision), svgs[node_id])
+        return {"version": version, "svgs": svgs, "not_found": not_found}
 
     def get_image_fills(self, file_key) -> dict[str, Any]:
         """
@@ -112,6 +528,274 @@ class FigmaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def _current_file_version(self, file_key) -> str:
+        return self.get_file(file_key, depth=1).get("version")
+
+    def _resolved_version(self, file_key, version=None) -> str:
+        if version is not None:
+            return version
+        version = self._file_versions.get(file_key)
+        if version is None:
+            version = self._current_file_version(file_key)
+            self._file_versions.set(file_key, version)
+        return version
+
+    def _get_page_indexes(self, file_key, version=None, bounds="bounding") -> dict[str, PageIndex]:
+        if bounds not in ("bounding", "render"):
+            raise ValueError("bounds must be 'bounding' or 'render'")
+        version = self._resolved_version(file_key, version)
+        key = (file_key, version, bounds)
+        indexes = self._spatial_indexes.get(key)
+        if indexes is None:
+            document = self.get_file(file_key, version=version).get("document") or {}
+            bounds_key = "absoluteBoundingBox" if bounds == "bounding" else "absoluteRenderBounds"
+            indexes = build_page_indexes(document, bounds_key)
+            self._spatial_indexes.set(key, indexes)
+        return indexes
+
+    def query_region(self, file_key, x, y, width, height, page=None, mode="intersects", version=None, bounds="bounding") -> dict[str, Any]:
+        """
+        Finds the nodes that fall in a rectangular region of the canvas using a per-page spatial index over node bounding boxes.
+
+        Args:
+            file_key (string): file_key
+            x (number): The left edge of the region in absolute canvas coordinates.
+            y (number): The top edge of the region in absolute canvas coordinates.
+            width (number): The width of the region.
+            height (number): The height of the region.
+            page (string): The ID or name of the page to search. Omitting this searches every page.
+            mode (string): "intersects" to return nodes that touch the region, or "contains" to return only nodes entirely inside it. Default: "intersects".
+            version (string): A specific version ID to get. Omitting this will get the current version of the file.
+            bounds (string): "bounding" to use `absoluteBoundingBox`, or "render" to use `absoluteRenderBounds`, which include effects such as shadows. Default: "bounding".
+
+        Returns:
+            dict[str, Any]: The matching nodes per page ID, each with its ID, name, type and box.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if None in (x, y, width, height):
+            raise ValueError("Missing required parameters 'x', 'y', 'width' and 'height'")
+        box = (x, y, x + width, y + height)
+        return {
+            page_id: index.query_region(box, mode)
+            for page_id, index in self._get_page_indexes(file_key, version, bounds).items()
+            if page is None or page in (page_id, index.name)
+        }
+
+    def find_overlaps(self, file_key, node_id, include_nested=False, version=None, bounds="bounding") -> list[dict[str, Any]]:
+        """
+        Finds the nodes on the same page whose bounding boxes overlap a given node, using a per-page spatial index.
+
+        Args:
+            file_key (string): file_key
+            node_id (string): The ID of the node to find overlaps for.
+            include_nested (boolean): Whether the node's ancestors and descendants, which always overlap it, are included. Default: false.
+            version (string): A specific version ID to get. Omitting this will get the current version of the file.
+            bounds (string): "bounding" to use `absoluteBoundingBox`, or "render" to use `absoluteRenderBounds`, which include effects such as shadows. Default: "bounding".
+
+        Returns:
+            list[dict[str, Any]]: The overlapping nodes, each with its ID, name, type and box.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if node_id is None:
+            raise ValueError("Missing required parameter 'node_id'")
+        for index in self._get_page_indexes(file_key, version, bounds).values():
+            if node_id in index.nodes:
+                return index.find_overlaps(node_id, include_nested=include_nested)
+        raise ValueError(f"Node '{node_id}' does not exist in file '{file_key}'")
+
+    def extract_text_content(self, file_keys=None, known_versions=None, batch_size=500, max_batches=None, cursor=None) -> dict[str, Any]:
+        """
+        Extracts the text of every TEXT node in one or more files, with its page and frame path and style, in batches suitable for bulk indexing, skipping files whose version has not changed since the last extraction.
+
+        Files are fetched one at a time as the batches are consumed, and with `max_batches` the batches are returned a few at a time along with a cursor for the rest. Each file is still downloaded and parsed as one document.
+
+        Args:
+            file_keys (array): The keys of the files to extract text from, as a list or a comma separated string. Not needed when passing a `cursor`.
+            known_versions (object): The file versions already indexed, keyed by file key. Files at these versions are skipped. Omitting this uses the versions and texts extracted earlier by this server.
+            batch_size (number): The number of text records per batch.
+            max_batches (number): The maximum number of batches to return. Omitting this returns every batch at once.
+            cursor (string): The cursor returned by a previous call, to continue with its remaining batches.
+
+        Returns:
+            dict[str, Any]: The extracted version of every file, the files that were skipped as unchanged, the batches of text records and a cursor when batches remain. Each record carries the hash of its text, and the text itself is only included the first time that hash appears, across calls when `known_versions` is omitted.
+
+        Tags:
+            Files
+        """
+        if cursor is not None:
+            extraction = self._text_cursors.pop(cursor)
+            if extraction is None:
+                raise ValueError(f"Cursor '{cursor}' is unknown or has expired")
+        else:
+            if file_keys is None:
+                raise ValueError("Missing required parameter 'file_keys'")
+            extraction = self._start_text_extraction(file_keys, known_versions, batch_size)
+        following = None
+        if max_batches is None:
+            batches, cursor = list(extraction["batches"]), None
+        else:
+            batches = list(itertools.islice(extraction["batches"], max_batches))
+            following = next(extraction["batches"], None)
+            if following is not None:
+                extraction["batches"] = itertools.chain([following], extraction["batches"])
+                cursor = cursor or uuid.uuid4().hex
+                self._text_cursors.set(cursor, extraction)
+            else:
+                cursor = None
+        if extraction["tracked"]:
+            self._commit_text_extraction(extraction, batches, following)
+        return {"versions": extraction["versions"], "skipped": extraction["skipped"], "batches": batches, "cursor": cursor}
+
+    def _start_text_extraction(self, file_keys, known_versions, batch_size) -> dict[str, Any]:
+        if isinstance(file_keys, str):
+            file_keys = [key.strip() for key in file_keys.split(",") if key.strip()]
+        # Texts are only deduplicated across calls against the versions this server tracks.
+        tracked = known_versions is None
+        known_versions = self._text_versions if tracked else known_versions
+        versions, skipped = {}, []
+        for file_key in file_keys:
+            version = self._current_file_version(file_key)
+            if known_versions.get(file_key) == version:
+                skipped.append(file_key)
+            else:
+                versions[file_key] = version
+
+        fetched = []
+
+        def files():
+            for file_key, version in versions.items():
+                fetched.append(file_key)
+                yield file_key, version, self.get_file(file_key, version=version).get("document") or {}
+
+        known = self._text_hashes if tracked else ()
+        batches = iter_text_batches(files(), batch_size=batch_size, known=known)
+        return {"versions": versions, "skipped": skipped, "batches": batches, "tracked": tracked, "fetched": fetched}
+
+    def _commit_text_extraction(self, extraction, batches, following) -> None:
+        # Only what was returned counts as indexed: the batch peeked behind a
+        # cursor, and the file it belongs to, are lost if the cursor is abandoned.
+        for batch in batches:
+            for record in batch:
+                self._text_hashes.set(record["hash"], True)
+        fetched = extraction["fetched"]
+        done = len(fetched) if following is None else fetched.index(following[0]["file_key"])
+        for file_key in fetched[:done]:
+            self._text_versions[file_key] = extraction["versions"][file_key]
+
+    def analyze_document(self, file_key, task, version=None) -> dict[str, Any]:
+        """
+        Runs an analysis over a whole file. Subtree hashing splits the document by top-level frame across the app's worker process pool and merges the per-partition results; the cheaper tasks run in the server process, where they finish faster than the document could be handed to workers.
+
+        Args:
+            file_key (string): file_key
+            task (string): The analysis to run: "index" (type, name, parent and page of every node), "subtree_hash" (a content hash of every node's subtree), "text" (every TEXT node with its path) or "component_usage" (instance node IDs per component ID).
+            version (string): A specific version ID to get. Omitting this will get the current version of the file.
+
+        Returns:
+            dict[str, Any]: The file version and the merged result of the task.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if task is None:
+            raise ValueError("Missing required parameter 'task'")
+        file = self.get_file(file_key, version=version)
+        if self._process_pool is None and self.analysis_workers > 1 and task in PARALLEL_TASKS:
+            self._process_pool = create_pool(self.analysis_workers)
+        result = process_document(file.get("document") or {}, task, max_workers=self.analysis_workers, executor=self._process_pool)
+        return {"version": file.get("version"), "task": task, "result": result}
+
+    def _snapshot_path(self, file_key, version) -> str:
+        # Both parts become a file name, so they must not be able to leave the directory.
+        for name, value in (("file_key", file_key), ("version", version)):
+            if not value or any(part in str(value) for part in ("/", "\\", "..", "\0")):
+                raise ValueError(f"Invalid {name} '{value}'")
+        directory = os.path.join(self.cache_dir, "snapshots")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{file_key}@{version}.figsnap")
+
+    def _open_snapshot(self, file_key, version=None) -> Snapshot:
+        current = version is None
+        version = self._resolved_version(file_key, version)
+        path = self._snapshot_path(file_key, version)
+        if not os.path.exists(path):
+            write_snapshot(self.get_file(file_key, version=version), path)
+        snapshot = self._snapshots.get(file_key)
+        if snapshot is None or snapshot.path != path:
+            if snapshot is not None:
+                snapshot.close()
+            snapshot = self._snapshots[file_key] = Snapshot(path)
+        if current:
+            self._prune_snapshots(file_key, keep=path)
+        return snapshot
+
+    def _prune_snapshots(self, file_key, keep) -> None:
+        # Snapshots of versions older than the current one are not read again.
+        pattern = os.path.join(glob.escape(os.path.dirname(keep)), f"{glob.escape(file_key)}@*.figsnap")
+        for path in glob.glob(pattern):
+            if path != keep:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    def snapshot_file(self, file_key, version=None) -> dict[str, Any]:
+        """
+        Stores a file at a version as a memory-mapped binary snapshot in the local cache, so worker processes can share one read-only copy and open it without parsing JSON.
+
+        Args:
+            file_key (string): file_key
+            version (string): A specific version ID to snapshot. Omitting this will snapshot the current version of the file.
+
+        Returns:
+            dict[str, Any]: The path, version, node count and size in bytes of the snapshot.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        snapshot = self._open_snapshot(file_key, version=version)
+        return {
+            "path": snapshot.path,
+            "version": snapshot.meta.get("version"),
+            "node_count": snapshot.node_count,
+            "bytes": os.path.getsize(snapshot.path),
+        }
+
+    def get_snapshot_node(self, file_key, node_id, version=None, depth=1) -> dict[str, Any]:
+        """
+        Retrieves a node and its children from the cached binary snapshot of a file, creating the snapshot on first use and decoding only the requested nodes.
+
+        Args:
+            file_key (string): file_key
+            node_id (string): The ID of the node to retrieve.
+            version (string): A specific version ID to get. Omitting this uses the snapshot most recently opened for the file, or the current version of the file.
+            depth (number): How many levels of children to include. Default: 1.
+
+        Returns:
+            dict[str, Any]: The node in the same shape as in the GET /v1/files/{file_key} response.
+
+        Tags:
+            Files
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if node_id is None:
+            raise ValueError("Missing required parameter 'node_id'")
+        node = self._open_snapshot(file_key, version=version).find(node_id)
+        if node is None:
+            raise ValueError(f"Node '{node_id}' does not exist in file '{file_key}'")
+        return node.to_dict(depth=depth)
+
     def get_team_projects(self, team_id) -> dict[str, Any]:
         """
         Retrieves a list of projects associated with a specific team identified by the team_id parameter.
@@ -389,11 +1073,16 @@ class FigmaApp(APIApplication):
         """
         if file_key is None:
             raise ValueError("Missing required parameter 'file_key'")
+        cached = self._cached_response('get_file_components', file_key, ('get_file_components', file_key))
+        if cached is not None:
+            return cached
         url = f"{self.base_url}/v1/files/{file_key}/components"
         query_params = {}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        self._cache_response(('get_file_components', file_key), result, size=len(response.content))
+        return result
 
     def get_component(self, key) -> dict[str, Any]:
         """
@@ -416,6 +1105,97 @@ class FigmaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    @property
+    def component_usage(self) -> ComponentUsageGraph:
+        if self._component_usage is None:
+            self._component_usage = ComponentUsageGraph(os.path.join(self.cache_dir, "component_usage.json"))
+        return self._component_usage
+
+    def update_component_usage(self, team_id, max_workers=4) -> dict[str, Any]:
+        """
+        Crawls the projects of a team and updates the persistent component usage graph, re-scanning only files modified since they were last scanned.
+
+        Args:
+            team_id (string): team_id
+            max_workers (number): The number of files fetched concurrently.
+
+        Returns:
+            dict[str, Any]: The number of files in the team, and how many were scanned, unchanged and removed, along with any files that failed to scan.
+
+        Tags:
+            Components
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team_id'")
+        graph = self.component_usage
+        after = None
+        while True:
+            meta = self.get_team_components(team_id, page_size=1000, after=after).get("meta") or {}
+            for component in meta.get("components") or []:
+                graph.components[component["key"]] = {"name": component.get("name"), "file_key": component.get("file_key")}
+            after = (meta.get("cursor") or {}).get("after")
+            if not meta.get("components") or after is None:
+                break
+        listed = {}
+        for project in self.get_team_projects(team_id).get("projects") or []:
+            for file in self.get_project_files(project["id"]).get("files") or []:
+                listed[file["key"]] = {**file, "project_id": project["id"]}
+        changed = [file for file_key, file in listed.items() if not graph.is_current(file_key, file.get("last_modified"))]
+        removed = [file_key for file_key in graph.team_files(team_id) if file_key not in listed]
+        for file_key in removed:
+            graph.remove_file(file_key)
+
+        def scan(file):
+            payload = self.get_file(file["key"])
+            graph.update_file(
+                file["key"],
+                {
+                    "team_id": team_id,
+                    "project_id": file["project_id"],
+                    "name": file.get("name"),
+                    "last_modified": file.get("last_modified"),
+                    "version": payload.get("version"),
+                    **scan_component_usages(payload),
+                },
+            )
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each scan runs in a copy of the caller's context so a tool deadline still applies.
+            futures = {file["key"]: executor.submit(contextvars.copy_context().run, scan, file) for file in changed}
+        for file_key, future in futures.items():
+            if future.exception() is not None:
+                errors.append({"file_key": file_key, "error": str(future.exception())})
+        graph.save()
+        return {
+            "files": len(listed),
+            "scanned": len(changed) - len(errors),
+            "unchanged": len(listed) - len(changed),
+            "removed": len(removed),
+            "errors": errors,
+        }
+
+    def find_component_usages(self, component_key, summary_only=False) -> dict[str, Any]:
+        """
+        Finds where a component is used from the persistent component usage graph, listing its instances per file and page along with impact totals.
+
+        Args:
+            component_key (string): The key of the main component.
+            summary_only (boolean): Whether to return only the totals and the instance count per file, without instance IDs. Default: false.
+
+        Returns:
+            dict[str, Any]: The component, the number of files, pages and instances using it, and the usages per file sorted by instance count.
+
+        Tags:
+            Components
+        """
+        if component_key is None:
+            raise ValueError("Missing required parameter 'component_key'")
+        usages = self.component_usage.usages(component_key)
+        if summary_only:
+            usages["files"] = [{key: file[key] for key in ("file_key", "name", "instances")} for file in usages["files"]]
+        return usages
+
     def get_team_component_sets(self, team_id, page_size=None, after=None, before=None) -> dict[str, Any]:
         """
         Retrieves a paginated list of component sets associated with a specific team ID, supporting pagination via page size, after, and before query parameters.
@@ -521,11 +1301,16 @@ class FigmaApp(APIApplication):
         """
         if file_key is None:
             raise ValueError("Missing required parameter 'file_key'")
+        cached = self._cached_response('get_file_styles', file_key, ('get_file_styles', file_key))
+        if cached is not None:
+            return cached
         url = f"{self.base_url}/v1/files/{file_key}/styles"
         query_params = {}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        self._cache_response(('get_file_styles', file_key), result, size=len(response.content))
+        return result
 
     def get_style(self, key) -> dict[str, Any]:
         """
@@ -823,6 +1608,111 @@ class FigmaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def _get_variable_resolver(self, file_key, version=None) -> VariableResolver:
+        # The variables endpoint only serves the current version of a file, so
+        # a cached resolver is reused while that version stays current.
+        current = self._resolved_version(file_key)
+        if version is not None and version != current:
+            current = self._current_file_version(file_key)
+            self._file_versions.set(file_key, current)
+            if version != current:
+                raise ValueError(f"Variables of file '{file_key}' are only available at its current version '{current}', not '{version}'")
+        resolver = self._variable_resolvers.get(file_key)
+        if resolver is None or resolver.version != current:
+            resolver = VariableResolver(self.get_local_variables(file_key), version=current)
+            self._variable_resolvers[file_key] = resolver
+        return resolver
+
+    def resolve_variable(self, file_key, name, mode=None, collection=None, version=None) -> dict[str, Any]:
+        """
+        Resolves a variable to its final value in a mode by following VARIABLE_ALIAS chains across collections, using a per-file cache of every resolved value that is rebuilt when the file version changes.
+
+        Args:
+            file_key (string): file_key
+            name (string): The variable ID or name, e.g. "color/primary".
+            mode (string): The mode ID or name to resolve in. Omitting this uses the default mode of the variable's collection.
+            collection (string): The collection ID or name, only needed when several collections define a variable with the same name.
+            version (string): The file version the values must belong to. Variables are only available for the current version of a file, so any other version raises an error. Omitting this uses the current version.
+
+        Returns:
+            dict[str, Any]: The resolved value, its type, mode and the chain of variable names that was followed.
+
+        Tags:
+            Variables
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if name is None:
+            raise ValueError("Missing required parameter 'name'")
+        resolver = self._get_variable_resolver(file_key, version=version)
+        return {"version": resolver.version, **resolver.resolve(name, mode=mode, collection=collection)}
+
+    def export_variable_tokens(self, file_key, version=None) -> dict[str, Any]:
+        """
+        Exports every local variable of a file as resolved design tokens, grouped by collection and mode, with aliases followed and cyclic aliases reported separately.
+
+        Args:
+            file_key (string): file_key
+            version (string): The file version the values must belong to. Variables are only available for the current version of a file, so any other version raises an error. Omitting this uses the current version.
+
+        Returns:
+            dict[str, Any]: The file version, the tokens keyed by collection, mode and variable name, and any variables whose aliases form a cycle.
+
+        Tags:
+            Variables
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        return self._get_variable_resolver(file_key, version=version).export_tokens()
+
+    def sync_variables(self, file_key, desired, delete_missing=False, dry_run=False, max_request_bytes=MAX_VARIABLES_REQUEST_BYTES) -> dict[str, Any]:
+        """
+        Syncs a file's local variables to a desired state by diffing it against the current variables and posting only the changes, packed into as few dependency-ordered requests as fit the request size limit.
+
+        Args:
+            file_key (string): file_key
+            desired (object): The desired variables keyed by collection name, each with a list of `modes` and a `variables` object mapping variable names to their `resolvedType`, optional `description`, `hiddenFromPublishing`, `scopes` and `codeSyntax`, and `values` keyed by mode name. Alias values are `{"type": "VARIABLE_ALIAS", "id": ...}` or `{"type": "VARIABLE_ALIAS", "collection": ..., "name": ...}`.
+            delete_missing (boolean): Whether variables of the desired collections that are not part of the desired state are deleted. Default: false.
+            dry_run (boolean): Whether to only return the planned batches without sending them. Default: false.
+            max_request_bytes (number): The maximum size of a single request body in bytes.
+
+        Returns:
+            dict[str, Any]: The number of changes per kind, the number of requests sent, the planned batches on a dry run and the mapping of temporary IDs to the real IDs created.
+
+        Tags:
+            Variables
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if desired is None:
+            raise ValueError("Missing required parameter 'desired'")
+        planner = VariableChangePlanner(self.get_local_variables(file_key), desired)
+        changes = planner.plan(delete_missing=delete_missing)
+        batches = pack_variable_batches(changes, max_bytes=max_request_bytes)
+        result = {
+            "changes": {kind: len(actions) for kind, actions in changes.items()},
+            "requests": 0,
+            "tempIdToRealId": {},
+        }
+        if dry_run:
+            result["batches"] = batches
+            return result
+        pending = collections.deque(batches)
+        while pending:
+            batch = pending.popleft()
+            replace_temp_ids(batch, result["tempIdToRealId"])
+            # Real IDs are longer than the temporary ones they replace, so a
+            # batch that outgrew the limit is split again before it is sent.
+            resized = pack_variable_batches(batch, max_bytes=max_request_bytes)
+            if len(resized) > 1:
+                pending.extendleft(reversed(resized))
+                continue
+            response = self.post_variables(file_key, **batch)
+            result["requests"] += 1
+            result["tempIdToRealId"].update((response.get("meta") or {}).get("tempIdToRealId") or {})
+        self._variable_resolvers.pop(file_key, None)
+        return result
+
     def get_dev_resources(self, file_key, node_ids=None) -> dict[str, Any]:
         """
         Retrieves development resources associated with a specific file, identified by its file_key, with optional filtering by node IDs.
@@ -915,12 +1805,79 @@ class FigmaApp(APIApplication):
         response.raise_for_status()
         return response.json()
 
+    def sync_dev_resources(self, file_key, desired, prune=True, dry_run=False, batch_size=DEV_RESOURCES_BATCH_SIZE, max_workers=8) -> dict[str, Any]:
+        """
+        Syncs the dev resources of a file to a desired set of node links, fetching the current state once and only creating, updating and deleting what differs, with writes sent in batches and deletes run concurrently.
+
+        Args:
+            file_key (string): file_key
+            desired (array): The desired dev resources, each an object with a `node_id`, a `url` and an optional `name` that defaults to the URL.
+            prune (boolean): Whether dev resources of the file that are not desired are deleted. Default: true.
+            dry_run (boolean): Whether to only return the planned changes without sending them. Default: false.
+            batch_size (number): The number of dev resources sent per create or update request.
+            max_workers (number): The number of deletes run concurrently.
+
+        Returns:
+            dict[str, Any]: The number of resources created, updated, deleted and left unchanged, the number of requests sent and any errors reported by the API, or the planned changes on a dry run.
+
+        Tags:
+            Dev Resources
+        """
+        if file_key is None:
+            raise ValueError("Missing required parameter 'file_key'")
+        if desired is None:
+            raise ValueError("Missing required parameter 'desired'")
+        current = self.get_dev_resources(file_key).get("dev_resources") or []
+        plan = diff_dev_resources(file_key, current, desired, prune=prune)
+        if dry_run:
+            return plan
+        result = {
+            "created": 0,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": len(plan["unchanged"]),
+            "requests": 1,
+            "errors": [],
+        }
+        for batch in chunked(plan["create"], batch_size):
+            response = self.post_dev_resources(batch)
+            result["requests"] += 1
+            result["created"] += len(response.get("links_created") or [])
+            result["errors"].extend(response.get("errors") or [])
+        for batch in chunked(plan["update"], batch_size):
+            response = self.put_dev_resources(batch)
+            result["requests"] += 1
+            result["updated"] += len(response.get("links_updated") or [])
+            result["errors"].extend(response.get("errors") or [])
+        if plan["delete"]:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    dev_resource_id: executor.submit(contextvars.copy_context().run, self.delete_dev_resource, file_key, dev_resource_id)
+                    for dev_resource_id in plan["delete"]
+                }
+            for dev_resource_id, future in futures.items():
+                result["requests"] += 1
+                error = future.exception()
+                if error is None:
+                    result["deleted"] += 1
+                else:
+                    result["errors"].append({"id": dev_resource_id, "error": str(error)})
+        return result
+
     def list_tools(self):
-        return [
+        tools = [
             self.get_file,
             self.get_file_nodes,
             self.get_images,
+            self.get_image_cache_stats,
+            self.export_vectors,
             self.get_image_fills,
+            self.extract_text_content,
+            self.analyze_document,
+            self.snapshot_file,
+            self.get_snapshot_node,
+            self.query_region,
+            self.find_overlaps,
             self.get_team_projects,
             self.get_project_files,
             self.get_file_versions,
@@ -934,6 +1891,8 @@ class FigmaApp(APIApplication):
             self.get_team_components,
             self.get_file_components,
             self.get_component,
+            self.update_component_usage,
+            self.find_component_usages,
             self.get_team_component_sets,
             self.get_file_component_sets,
             self.get_component_set,
@@ -951,8 +1910,16 @@ class FigmaApp(APIApplication):
             self.get_local_variables,
             self.get_published_variables,
             self.post_variables,
+            self.resolve_variable,
+            self.export_variable_tokens,
+            self.sync_variables,
             self.get_dev_resources,
             self.post_dev_resources,
             self.put_dev_resources,
-            self.delete_dev_resource
+            self.delete_dev_resource,
+            self.sync_dev_resources,
+            self.get_request_latency_stats,
+            self.get_tool_profiles,
+            self.get_warmup_status,
         ]
+        return [self._wrap_tool(tool) for tool in tools]
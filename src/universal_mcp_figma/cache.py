@@ -0,0 +1,99 @@
+"""In-memory caches shared by the Figma tools."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """A thread-safe LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    Besides ``max_entries``, the total of the sizes given to ``set`` can be
+    capped with ``max_bytes``. Hits and misses are counted so callers can
+    report the hit ratio.
+    """
+
+    def __init__(
+        self, ttl: float, max_entries: int = 10_000, max_bytes: int | None = None
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not _MISSING:
+                self._discard(key)
+            self.misses += 1
+            return default
+
+    def set(
+        self, key: Hashable, value: Any, ttl: float | None = None, size: int = 0
+    ) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._discard(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = (expires, value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                self.bytes -= self._entries.popitem(last=False)[1][2]
+
+    def _discard(self, key: Hashable) -> tuple[float, Any, int] | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+        return entry
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def remaining(self, key: Hashable) -> float:
+        """Returns the seconds until an entry expires, or 0 when it is missing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return 0.0 if entry is None else max(0.0, entry[0] - time.monotonic())
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._discard(key)
+            return (
+                default if entry is None or entry[0] <= time.monotonic() else entry[1]
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,64 @@
+"""Diffing of dev resources against a desired set of node links."""
+
+from typing import Any
+
+# Number of dev resources sent per POST/PUT /v1/dev_resources request.
+DEV_RESOURCES_BATCH_SIZE = 500
+
+
+def dev_resource_key(resource: dict[str, Any]) -> tuple[str, str]:
+    """Dev resources are identified by the node they are attached to and their URL."""
+    return resource.get("node_id"), resource.get("url")
+
+
+def diff_dev_resources(
+    file_key: str,
+    current: list[dict[str, Any]],
+    desired: list[dict[str, Any]],
+    prune: bool = True,
+) -> dict[str, list[Any]]:
+    """Returns the minimal sets of dev resources to create, update and delete.
+
+    A desired resource that matches an existing one by node and URL is only
+    updated when its name differs, and is otherwise listed as unchanged.
+    Desired resources repeating the same node and URL count once. With ``prune`` every existing resource that
+    is not desired is deleted, otherwise existing resources are left alone.
+    """
+    existing = {dev_resource_key(resource): resource for resource in current}
+    wanted: dict[tuple[str, str], dict[str, Any]] = {}
+    for resource in desired:
+        if resource.get("node_id") is None or resource.get("url") is None:
+            raise ValueError("Every desired dev resource needs a 'node_id' and a 'url'")
+        wanted[dev_resource_key(resource)] = resource
+    create, update, unchanged = [], [], []
+    for key, resource in wanted.items():
+        name = resource.get("name") or resource["url"]
+        match = existing.get(key)
+        if match is None:
+            create.append(
+                {
+                    "name": name,
+                    "url": resource["url"],
+                    "file_key": file_key,
+                    "node_id": resource["node_id"],
+                }
+            )
+        elif match.get("name") != name:
+            update.append({"id": match["id"], "name": name})
+        else:
+            unchanged.append(match["id"])
+    delete = (
+        [resource["id"] for key, resource in existing.items() if key not in wanted]
+        if prune
+        else []
+    )
+    return {
+        "create": create,
+        "update": update,
+        "delete": delete,
+        "unchanged": unchanged,
+    }
+
+
+def chunked(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
@@ -0,0 +1,118 @@
+"""Timeouts, deadlines and latency tracking for Figma API requests."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import urlparse
+
+# Path segments that are part of an endpoint rather than an identifier.
+STATIC_SEGMENTS = frozenset(
+    {
+        "v1",
+        "v2",
+        "files",
+        "nodes",
+        "images",
+        "teams",
+        "projects",
+        "versions",
+        "comments",
+        "reactions",
+        "me",
+        "components",
+        "component_sets",
+        "styles",
+        "webhooks",
+        "requests",
+        "activity_logs",
+        "payments",
+        "variables",
+        "local",
+        "published",
+        "dev_resources",
+    }
+)
+
+# Per-endpoint request timeouts in seconds; other endpoints use the client default.
+DEFAULT_ENDPOINT_TIMEOUTS = {
+    "/v1/files/{}": 120.0,
+    "/v1/files/{}/nodes": 60.0,
+    "/v1/images/{}": 90.0,
+}
+
+# Endpoints with heavy tail latency that are worth hedging when enabled.
+DEFAULT_HEDGED_ENDPOINTS = frozenset({"/v1/files/{}/nodes", "/v1/images/{}"})
+
+_deadline: ContextVar[float | None] = ContextVar("figma_deadline", default=None)
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the endpoint of a URL with its identifiers replaced, e.g. ``/v1/files/{}/nodes``."""
+    segments = urlparse(url).path.strip("/").split("/")
+    return "/" + "/".join(
+        segment if segment in STATIC_SEGMENTS else "{}" for segment in segments
+    )
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bounds every request made in the block, including nested ones, to finish within ``seconds``.
+
+    Nested deadlines can only shorten the enclosing one. Work handed to other
+    threads only sees the deadline when run in a copy of the caller's context,
+    e.g. with ``contextvars.copy_context().run``.
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Returns the seconds left until the current deadline, or None without one."""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+class LatencyTracker:
+    """Keeps a rolling window of request durations per endpoint."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, quantile: float) -> float | None:
+        """Returns the quantile of recent durations, or None until enough samples exist."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint) or ())
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(quantile * len(samples)))]
+
+    def stats(self) -> dict[str, dict[str, float | int | None]]:
+        with self._lock:
+            endpoints = list(self._samples)
+        return {
+            endpoint: {
+                "samples": len(self._samples[endpoint]),
+                "p50": self.percentile(endpoint, 0.5),
+                "p95": self.percentile(endpoint, 0.95),
+                "p99": self.percentile(endpoint, 0.99),
+            }
+            for endpoint in endpoints
+        }
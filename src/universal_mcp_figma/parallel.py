@@ -0,0 +1,203 @@
+"""Parallel processing of large Figma documents across a process pool.
+
+A document is split into its top-level frames, each encoded once as compact
+JSON bytes. Workers receive those bytes instead of pickled dicts, run one of the
+registered tasks over their partition and return a small result that the parent
+merges.
+
+Workers are started with ``forkserver`` where available and ``spawn``
+otherwise, never by forking the calling process, which may be running other
+threads whose locks a forked child would inherit in a held state.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from universal_mcp_figma.text import iter_text_nodes
+
+# Partitions smaller than this many encoded bytes in total are processed in
+# the calling process, where starting workers would cost more than it saves.
+MIN_PARALLEL_BYTES = 1024 * 1024
+# The tasks that do enough work per node to repay encoding their partitions in
+# the calling process. Walking a frame for the index, text or component usage
+# costs less than encoding it, so those tasks always run in the calling process.
+PARALLEL_TASKS = frozenset({"subtree_hash"})
+
+Unit = tuple[str, str, dict[str, Any]]
+
+
+def _walk(node: dict[str, Any], parent_id: str | None = None):
+    stack = [(node, parent_id)]
+    while stack:
+        current, parent = stack.pop()
+        yield current, parent
+        children = current.get("children") or []
+        stack.extend((child, current.get("id")) for child in reversed(children))
+
+
+def index_task(units: list[Unit]) -> dict[str, Any]:
+    index = {}
+    for page_id, _, root in units:
+        for node, parent in _walk(root, page_id):
+            index[node.get("id")] = {
+                "type": node.get("type"),
+                "name": node.get("name"),
+                "parent": parent,
+                "page": page_id,
+            }
+    return index
+
+
+def subtree_hash_task(units: list[Unit]) -> dict[str, Any]:
+    hashes: dict[str, str] = {}
+    for _, _, root in units:
+        # Post-order: a node is hashed after all of its children.
+        for node, _ in reversed(list(_walk(root))):
+            own = {key: value for key, value in node.items() if key != "children"}
+            digest = hashlib.sha1(
+                json.dumps(own, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            )
+            for child in node.get("children") or []:
+                digest.update(hashes[child.get("id")].encode("ascii"))
+            hashes[node.get("id")] = digest.hexdigest()
+    return hashes
+
+
+def text_task(units: list[Unit]) -> list[dict[str, Any]]:
+    records = []
+    for page_id, page_name, root in units:
+        page = {"id": page_id, "name": page_name, "children": [root]}
+        records.extend(iter_text_nodes({"children": [page]}))
+    return records
+
+
+def component_usage_task(units: list[Unit]) -> dict[str, Any]:
+    usage: dict[str, list[str]] = {}
+    for _, _, root in units:
+        for node, _ in _walk(root):
+            if node.get("type") == "INSTANCE" and node.get("componentId"):
+                usage.setdefault(node["componentId"], []).append(node.get("id"))
+    return usage
+
+
+def _merge_dicts(results: list[dict[str, Any]]) -> dict[str, Any]:
+    merged: dict[str, Any] = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+def _merge_lists(results: list[list[Any]]) -> list[Any]:
+    return [item for result in results for item in result]
+
+
+def _merge_usage(results: list[dict[str, list[str]]]) -> dict[str, list[str]]:
+    merged: dict[str, list[str]] = {}
+    for result in results:
+        for component_id, instances in result.items():
+            merged.setdefault(component_id, []).extend(instances)
+    return merged
+
+
+TASKS: dict[str, tuple[Callable[[list[Unit]], Any], Callable[[list[Any]], Any]]] = {
+    "index": (index_task, _merge_dicts),
+    "subtree_hash": (subtree_hash_task, _merge_dicts),
+    "text": (text_task, _merge_lists),
+    "component_usage": (component_usage_task, _merge_usage),
+}
+
+
+def iter_units(document: dict[str, Any]):
+    for page in document.get("children") or []:
+        for child in page.get("children") or []:
+            yield page.get("id"), page.get("name"), child
+
+
+def encode_units(document: dict[str, Any]) -> list[tuple[str, str, bytes]]:
+    """Splits a document into its top-level frames, each encoded as compact JSON."""
+    return [
+        (page_id, page_name, json.dumps(root, separators=(",", ":")).encode("utf-8"))
+        for page_id, page_name, root in iter_units(document)
+    ]
+
+
+def balance(units: list[tuple[str, str, bytes]], partitions: int):
+    """Distributes units over partitions, largest first onto the lightest partition."""
+    bins: list[list[tuple[str, str, bytes]]] = [[] for _ in range(partitions)]
+    sizes = [0] * partitions
+    for unit in sorted(units, key=lambda unit: len(unit[2]), reverse=True):
+        lightest = sizes.index(min(sizes))
+        bins[lightest].append(unit)
+        sizes[lightest] += len(unit[2])
+    return [partition for partition in bins if partition]
+
+
+def run_partition(task: str, partition: list[tuple[str, str, bytes]]) -> Any:
+    units = [
+        (page_id, page_name, json.loads(data)) for page_id, page_name, data in partition
+    ]
+    return TASKS[task][0](units)
+
+
+def create_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Creates a process pool whose workers do not inherit the threads of the caller."""
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1, mp_context=context
+    )
+
+
+def process_document(
+    document: dict[str, Any],
+    task: str,
+    max_workers: int | None = None,
+    executor: ProcessPoolExecutor | None = None,
+) -> Any:
+    """Runs a registered task over a whole document, in parallel when it is worth it.
+
+    Partitions run on ``executor``, which callers should keep for many calls
+    since starting workers is expensive; without one a pool is created for the
+    call. Splitting and encoding the document happens serially in the calling
+    process and grows with the document, so only tasks in ``PARALLEL_TASKS``
+    are sent to workers. Pages themselves are not part of any partition; the
+    ``index`` task adds them to its result after merging.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Unknown task '{task}', expected one of {sorted(TASKS)}")
+    run, merge = TASKS[task]
+    max_workers = max_workers or os.cpu_count() or 1
+    worth_it = max_workers > 1 and task in PARALLEL_TASKS
+    units = encode_units(document) if worth_it else []
+    total = sum(len(unit[2]) for unit in units)
+    if len(units) < 2 or total < MIN_PARALLEL_BYTES:
+        results = [run(list(iter_units(document)))]
+    else:
+        # A few partitions per worker keeps workers busy when frames differ in size.
+        partitions = balance(units, min(len(units), max_workers * 4))
+        if executor is not None:
+            results = list(
+                executor.map(run_partition, [task] * len(partitions), partitions)
+            )
+        else:
+            with create_pool(max_workers) as pool:
+                results = list(
+                    pool.map(run_partition, [task] * len(partitions), partitions)
+                )
+    result = merge(results)
+    if task == "index":
+        for page in document.get("children") or []:
+            result[page.get("id")] = {
+                "type": page.get("type"),
+                "name": page.get("name"),
+                "parent": document.get("id"),
+                "page": page.get("id"),
+            }
+    return result
@@ -0,0 +1,239 @@
+"""Opt-in sampling profiler for tool calls with speedscope output.
+
+A single background thread samples the stacks of the threads running profiled
+tool calls at a fixed interval. Each sample is attributed to a phase from the
+frames on its stack: ``request`` (HTTP client and socket code), ``decode``
+(JSON parsing of responses) or ``compute`` for everything else. The MCP server
+encodes tool results outside of the tool call, so the ``serialize`` phase is
+an estimate from encoding the result of a kept call once more as JSON. Profiles that are
+kept are written in the speedscope format with the phase as the root frame, so
+they open as flamegraphs at https://www.speedscope.app.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+REQUEST_MODULES = (
+    "httpx",
+    "httpcore",
+    "h11",
+    "h2",
+    "ssl.py",
+    "socket.py",
+    "selectors.py",
+)
+REQUEST_FUNCTIONS = frozenset(
+    {"_get", "_post", "_put", "_delete", "_send", "_timed_request", "_hedged_get"}
+)
+MAX_STACK_DEPTH = 128
+
+
+def serialize_result(result: Any) -> str:
+    return json.dumps(result, default=str)
+
+
+def estimate_serialization(result: Any) -> float | None:
+    """Returns the seconds taken to encode a result as JSON, or None when it cannot be encoded."""
+    started = time.perf_counter()
+    try:
+        serialize_result(result)
+    except (TypeError, ValueError, RecursionError):
+        return None
+    return time.perf_counter() - started
+
+
+def classify(stack: list[tuple[str, str, int]]) -> str:
+    """Returns the phase of a sample from its frames, ordered from root to leaf."""
+    phase = "compute"
+    for filename, function, _ in stack:
+        if function == "serialize_result":
+            return "serialize"
+        if os.path.join("json", "decoder.py") in filename or (
+            function == "loads"
+            and filename.endswith(os.path.join("json", "__init__.py"))
+        ):
+            return "decode"
+        if function in REQUEST_FUNCTIONS or any(
+            module in filename for module in REQUEST_MODULES
+        ):
+            phase = "request"
+    return phase
+
+
+class _Recording:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started = time.perf_counter()
+        self.samples: list[tuple[str, list[tuple[str, str, int]]]] = []
+
+
+class Sampler:
+    """Samples the stacks of registered threads from one shared daemon thread."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._recordings: dict[int, _Recording] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+
+    def start(self, name: str) -> _Recording:
+        recording = _Recording(name)
+        with self._lock:
+            self._recordings[threading.get_ident()] = recording
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="figma-profiler", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+        return recording
+
+    def stop(self) -> None:
+        with self._lock:
+            self._recordings.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                # Sleep without sampling while no profiled call is running.
+                while not self._recordings:
+                    self._wakeup.wait()
+                recordings = dict(self._recordings)
+            frames = sys._current_frames()
+            for thread_id, recording in recordings.items():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_name, frame.f_lineno))
+                    frame = frame.f_back
+                stack.reverse()
+                recording.samples.append((classify(stack), stack))
+            del frames
+            time.sleep(self.interval)
+
+
+def to_speedscope(
+    recording: _Recording, duration: float, interval: float
+) -> dict[str, Any]:
+    frames: list[dict[str, Any]] = []
+    frame_ids: dict[tuple[str, str, int | None], int] = {}
+
+    def frame_id(filename: str, function: str, line: int | None) -> int:
+        key = (filename, function, line)
+        if key not in frame_ids:
+            frame_ids[key] = len(frames)
+            frames.append({"name": function, "file": filename, "line": line})
+        return frame_ids[key]
+
+    samples = [
+        [frame_id("", f"phase:{phase}", None)]
+        + [frame_id(filename, function, line) for filename, function, line in stack]
+        for phase, stack in recording.samples
+    ]
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "exporter": "universal_mcp_figma",
+        "name": recording.name,
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": recording.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": duration,
+                "samples": samples,
+                "weights": [interval] * len(samples),
+            }
+        ],
+    }
+
+
+class ToolProfiler:
+    """Profiles selected tool calls and calls slower than a threshold.
+
+    Calls of tools in ``tools`` (or every tool for ``"*"``) are always kept.
+    With a ``threshold`` every call is sampled and kept only when it took longer
+    than ``threshold`` seconds. Kept profiles are written to ``directory`` and
+    summarized in memory; only the last ``history`` of them are kept, and the
+    files of older ones are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        tools: Iterable[str] | None = None,
+        threshold: float | None = None,
+        interval: float = 0.01,
+        history: int = 50,
+    ) -> None:
+        self.directory = directory
+        self.tools = frozenset(tools or ())
+        self.threshold = threshold
+        self.interval = interval
+        self.profiles: deque[dict[str, Any]] = deque(maxlen=history)
+        self._sampler = Sampler(interval)
+        self._lock = threading.Lock()
+
+    def selects(self, name: str) -> bool:
+        return self.threshold is not None or "*" in self.tools or name in self.tools
+
+    def call(
+        self, name: str, tool: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        recording = self._sampler.start(name)
+        try:
+            result = tool(*args, **kwargs)
+            forced = "*" in self.tools or name in self.tools
+            slow = self.threshold is not None and (
+                time.perf_counter() - recording.started >= self.threshold
+            )
+            # Only kept calls pay for encoding their result a second time.
+            serialize_seconds = (
+                estimate_serialization(result) if forced or slow else None
+            )
+        finally:
+            self._sampler.stop()
+        if forced or slow:
+            duration = time.perf_counter() - recording.started
+            self._keep(recording, duration, serialize_seconds)
+        return result
+
+    def _keep(
+        self, recording: _Recording, duration: float, serialize_seconds: float | None
+    ) -> None:
+        phases = {"request": 0.0, "decode": 0.0, "serialize": 0.0, "compute": 0.0}
+        for phase, _ in recording.samples:
+            phases[phase] += self.interval
+        phases["serialize"] = serialize_seconds
+        os.makedirs(self.directory, exist_ok=True)
+        timestamp = time.strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(
+            self.directory,
+            f"{recording.name}-{timestamp}-{uuid.uuid4().hex[:8]}.speedscope.json",
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(to_speedscope(recording, duration, self.interval), file)
+        profile = {
+            "tool": recording.name,
+            "seconds": duration,
+            "samples": len(recording.samples),
+            "phases": phases,
+            "path": path,
+        }
+        with self._lock:
+            if len(self.profiles) == self.profiles.maxlen:
+                with contextlib.suppress(OSError):
+                    os.remove(self.profiles[0]["path"])
+            self.profiles.append(profile)
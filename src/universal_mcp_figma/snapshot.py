@@ -0,0 +1,299 @@
+"""Memory-mappable binary snapshots of Figma documents.
+
+A snapshot stores a ``GET /v1/files/{file_key}`` payload as::
+
+    header | string index | string data | node table | id index | blobs
+
+Nodes are laid out breadth first so the children of a node are contiguous and
+only need a first child index and a count. Node ids, names and types live in a
+shared string pool; every other node property is a compact JSON blob that is
+only decoded when it is accessed. The id index holds node indexes sorted by
+node id, so lookups are binary searches and opening a snapshot does not build
+any per-node structure. Because the file is mapped read-only, every process that
+opens the same snapshot shares one copy of it through the page cache.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+from typing import Any
+
+MAGIC = b"FIGSNAP\x00"
+FORMAT_VERSION = 1
+
+# magic, format version, node count, string count, padding, then the offsets of
+# the string index, string data, node table, id index and blobs, and the offset
+# and length of the file metadata blob.
+HEADER = struct.Struct("<8sIIII7Q")
+# offset and length of a string in the string data.
+STRING_ENTRY = struct.Struct("<QI")
+# id, name and type string indexes, parent, first child, child count, and the
+# offset and length of the property blob.
+NODE_ENTRY = struct.Struct("<IIIiIIQI")
+ID_ENTRY = struct.Struct("<I")
+
+NO_PARENT = -1
+STRUCTURAL_KEYS = ("id", "name", "type", "children")
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a snapshot this module can read."""
+
+
+def _compact(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def write_snapshot(payload: dict[str, Any], path: str) -> int:
+    """Writes a file payload as a snapshot to ``path`` and returns the number of nodes.
+
+    The snapshot is written to a temporary file and moved into place, so readers
+    never observe a partially written snapshot.
+    """
+    document = payload.get("document") or {}
+    meta = _compact({key: value for key, value in payload.items() if key != "document"})
+
+    strings: dict[str, int] = {}
+
+    def intern(value: str | None) -> int:
+        value = value or ""
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    nodes = []
+    blobs = [meta]
+    blob_offset = len(meta)
+    queue: deque[tuple[dict[str, Any], int]] = deque([(document, NO_PARENT)])
+    while queue:
+        node, parent = queue.popleft()
+        index = len(nodes)
+        children = node.get("children") or []
+        blob = _compact({k: v for k, v in node.items() if k not in STRUCTURAL_KEYS})
+        blobs.append(blob)
+        # first child is filled in below once the position of the children is known.
+        nodes.append(
+            [
+                intern(node.get("id")),
+                intern(node.get("name")),
+                intern(node.get("type")),
+                parent,
+                0,
+                len(children),
+                blob_offset,
+                len(blob),
+            ]
+        )
+        blob_offset += len(blob)
+        nodes[index][4] = index + 1 + len(queue)
+        queue.extend((child, index) for child in children)
+
+    encoded_strings = [value.encode("utf-8") for value in strings]
+    id_order = sorted(
+        range(len(nodes)), key=lambda index: encoded_strings[nodes[index][0]]
+    )
+
+    string_index_offset = HEADER.size
+    string_data_offset = string_index_offset + STRING_ENTRY.size * len(encoded_strings)
+    node_table_offset = string_data_offset + sum(
+        len(value) for value in encoded_strings
+    )
+    id_index_offset = node_table_offset + NODE_ENTRY.size * len(nodes)
+    blobs_offset = id_index_offset + ID_ENTRY.size * len(nodes)
+
+    # A unique temporary name keeps concurrent writers of one path apart.
+    descriptor, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", suffix=".tmp"
+    )
+    with os.fdopen(descriptor, "wb") as file:
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                len(nodes),
+                len(encoded_strings),
+                0,
+                string_index_offset,
+                string_data_offset,
+                node_table_offset,
+                id_index_offset,
+                blobs_offset,
+                0,
+                len(meta),
+            )
+        )
+        offset = 0
+        for value in encoded_strings:
+            file.write(STRING_ENTRY.pack(offset, len(value)))
+            offset += len(value)
+        for value in encoded_strings:
+            file.write(value)
+        for entry in nodes:
+            file.write(NODE_ENTRY.pack(*entry))
+        for index in id_order:
+            file.write(ID_ENTRY.pack(index))
+        for blob in blobs:
+            file.write(blob)
+    os.replace(temporary, path)
+    return len(nodes)
+
+
+class SnapshotNode:
+    """A node of a snapshot whose properties are decoded on first access."""
+
+    __slots__ = ("_snapshot", "index", "_props")
+
+    def __init__(self, snapshot: "Snapshot", index: int) -> None:
+        self._snapshot = snapshot
+        self.index = index
+        self._props: dict[str, Any] | None = None
+
+    def _entry(self) -> tuple[int, ...]:
+        return self._snapshot._node_entry(self.index)
+
+    @property
+    def id(self) -> str:
+        return self._snapshot._string(self._entry()[0])
+
+    @property
+    def name(self) -> str:
+        return self._snapshot._string(self._entry()[1])
+
+    @property
+    def type(self) -> str:
+        return self._snapshot._string(self._entry()[2])
+
+    @property
+    def parent(self) -> "SnapshotNode | None":
+        parent = self._entry()[3]
+        return None if parent == NO_PARENT else SnapshotNode(self._snapshot, parent)
+
+    @property
+    def children(self) -> list["SnapshotNode"]:
+        first_child, child_count = self._entry()[4:6]
+        return [
+            SnapshotNode(self._snapshot, index)
+            for index in range(first_child, first_child + child_count)
+        ]
+
+    @property
+    def props(self) -> dict[str, Any]:
+        if self._props is None:
+            offset, length = self._entry()[6:8]
+            self._props = self._snapshot._blob(offset, length)
+        return self._props
+
+    def __getitem__(self, key: str) -> Any:
+        if key in ("id", "name", "type"):
+            return getattr(self, key)
+        return self.props[key]
+
+    def to_dict(self, depth: int | None = None) -> dict[str, Any]:
+        """Decodes the node back into the API's shape, down to ``depth`` levels of children."""
+        node = {"id": self.id, "name": self.name, "type": self.type, **self.props}
+        if self._entry()[5] and (depth is None or depth > 0):
+            node["children"] = [
+                child.to_dict(None if depth is None else depth - 1)
+                for child in self.children
+            ]
+        return node
+
+
+class Snapshot:
+    """A read-only, memory-mapped snapshot of a Figma document."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if len(self._view) < HEADER.size:
+            self.close()
+            raise SnapshotError(f"{path} is not a Figma snapshot")
+        (
+            magic,
+            format_version,
+            self.node_count,
+            self.string_count,
+            _,
+            self._string_index,
+            self._string_data,
+            self._node_table,
+            self._id_index,
+            self._blobs,
+            meta_offset,
+            meta_length,
+        ) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise SnapshotError(
+                f"{path} is not a version {FORMAT_VERSION} Figma snapshot"
+            )
+        self._meta_location = (meta_offset, meta_length)
+        self._meta: dict[str, Any] | None = None
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        """The top-level payload fields other than the document, e.g. name, version and components."""
+        if self._meta is None:
+            self._meta = self._blob(*self._meta_location)
+        return self._meta
+
+    @property
+    def root(self) -> SnapshotNode:
+        return SnapshotNode(self, 0)
+
+    def _string_bytes(self, index: int) -> bytes:
+        offset, length = STRING_ENTRY.unpack_from(
+            self._view, self._string_index + index * STRING_ENTRY.size
+        )
+        start = self._string_data + offset
+        return self._view[start : start + length].tobytes()
+
+    def _string(self, index: int) -> str:
+        return self._string_bytes(index).decode("utf-8")
+
+    def _node_entry(self, index: int) -> tuple[int, ...]:
+        return NODE_ENTRY.unpack_from(
+            self._view, self._node_table + index * NODE_ENTRY.size
+        )
+
+    def _blob(self, offset: int, length: int) -> dict[str, Any]:
+        start = self._blobs + offset
+        return json.loads(self._view[start : start + length].tobytes())
+
+    def node(self, index: int) -> SnapshotNode:
+        if not 0 <= index < self.node_count:
+            raise IndexError(index)
+        return SnapshotNode(self, index)
+
+    def find(self, node_id: str) -> SnapshotNode | None:
+        """Returns the node with the given id with a binary search over the id index."""
+        target = node_id.encode("utf-8")
+        low, high = 0, self.node_count
+        while low < high:
+            middle = (low + high) // 2
+            (index,) = ID_ENTRY.unpack_from(
+                self._view, self._id_index + middle * ID_ENTRY.size
+            )
+            candidate = self._string_bytes(self._node_entry(index)[0])
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return SnapshotNode(self, index)
+        return None
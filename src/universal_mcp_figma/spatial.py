@@ -0,0 +1,196 @@
+"""Spatial indexing of node bounding boxes for region and overlap queries."""
+
+import math
+from collections.abc import Iterator
+from typing import Any
+
+Box = tuple[float, float, float, float]
+
+
+def node_box(node: dict[str, Any], key: str = "absoluteBoundingBox") -> Box | None:
+    """Returns a node's box as ``(min_x, min_y, max_x, max_y)``, or None when it has none."""
+    bounds = node.get(key)
+    if not bounds:
+        return None
+    x, y = bounds.get("x", 0), bounds.get("y", 0)
+    return x, y, x + bounds.get("width", 0), y + bounds.get("height", 0)
+
+
+def intersects(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def overlaps(a: Box, b: Box) -> bool:
+    """Like ``intersects``, but boxes that only share an edge or corner do not overlap."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def contains(outer: Box, inner: Box) -> bool:
+    return (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
+
+
+def _union(boxes: list[Box]) -> Box:
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+class _Node:
+    __slots__ = ("box", "children", "leaf")
+
+    def __init__(self, children: list[Any], leaf: bool) -> None:
+        self.children = children
+        self.leaf = leaf
+        self.box = _union([child[0] if leaf else child.box for child in children])
+
+
+class SpatialIndex:
+    """A static R-tree bulk loaded with Sort-Tile-Recursive packing.
+
+    Queries descend only into subtrees whose box intersects the query, which is
+    logarithmic in the number of nodes for the small regions layout analysis
+    asks about.
+    """
+
+    def __init__(self, entries: list[tuple[Box, str]], capacity: int = 16) -> None:
+        self.capacity = capacity
+        self.boxes: dict[str, Box] = {item: box for box, item in entries}
+        self._root: _Node | None = None
+        level: list[Any] = self._pack(list(entries), leaf=True)
+        while len(level) > 1:
+            level = self._pack(level, leaf=False)
+        if level:
+            self._root = level[0]
+
+    def _pack(self, items: list[Any], leaf: bool) -> list[_Node]:
+        def box_of(item):
+            return item[0] if leaf else item.box
+
+        def center(item, axis):
+            box = box_of(item)
+            return box[axis] + box[axis + 2]
+
+        if not items:
+            return []
+        pages = math.ceil(len(items) / self.capacity)
+        slice_size = self.capacity * math.ceil(math.sqrt(pages))
+        items.sort(key=lambda item: center(item, 0))
+        nodes = []
+        for start in range(0, len(items), slice_size):
+            column = sorted(
+                items[start : start + slice_size], key=lambda item: center(item, 1)
+            )
+            for offset in range(0, len(column), self.capacity):
+                nodes.append(_Node(column[offset : offset + self.capacity], leaf))
+        return nodes
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def _search(self, box: Box) -> Iterator[tuple[Box, str]]:
+        if self._root is None or not intersects(self._root.box, box):
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                for entry in node.children:
+                    if intersects(entry[0], box):
+                        yield entry
+            else:
+                stack.extend(
+                    child for child in node.children if intersects(child.box, box)
+                )
+
+    def query(self, box: Box, mode: str = "intersects") -> list[str]:
+        """Returns the items whose box intersects ``box``, or lies within it when ``mode`` is "contains"."""
+        if mode not in ("intersects", "contains"):
+            raise ValueError("mode must be 'intersects' or 'contains'")
+        return [
+            item
+            for entry_box, item in self._search(box)
+            if mode == "intersects" or contains(box, entry_box)
+        ]
+
+
+class PageIndex:
+    """The spatial index of one page along with the tree structure needed to filter results."""
+
+    def __init__(
+        self, page: dict[str, Any], bounds_key: str = "absoluteBoundingBox"
+    ) -> None:
+        self.page_id = page.get("id")
+        self.name = page.get("name")
+        self.parents: dict[str, str] = {}
+        self.nodes: dict[str, dict[str, Any]] = {}
+        entries = []
+        stack = [(child, self.page_id) for child in page.get("children") or []]
+        while stack:
+            node, parent = stack.pop()
+            node_id = node.get("id")
+            self.parents[node_id] = parent
+            self.nodes[node_id] = {
+                "id": node_id,
+                "name": node.get("name"),
+                "type": node.get("type"),
+            }
+            box = node_box(node, bounds_key)
+            if box is not None:
+                entries.append((box, node_id))
+            stack.extend((child, node_id) for child in node.get("children") or [])
+        self.index = SpatialIndex(entries)
+
+    def ancestors(self, node_id: str) -> Iterator[str]:
+        parent = self.parents.get(node_id)
+        while parent is not None and parent != self.page_id:
+            yield parent
+            parent = self.parents.get(parent)
+
+    def describe(self, node_id: str) -> dict[str, Any]:
+        box = self.index.boxes[node_id]
+        return {
+            **self.nodes[node_id],
+            "x": box[0],
+            "y": box[1],
+            "width": box[2] - box[0],
+            "height": box[3] - box[1],
+        }
+
+    def query_region(self, box: Box, mode: str = "intersects") -> list[dict[str, Any]]:
+        return [self.describe(node_id) for node_id in self.index.query(box, mode)]
+
+    def find_overlaps(
+        self, node_id: str, include_nested: bool = False
+    ) -> list[dict[str, Any]]:
+        """Returns the nodes overlapping a node, leaving out its ancestors and descendants unless asked."""
+        box = self.index.boxes.get(node_id)
+        if box is None:
+            return []
+        ancestors = set(self.ancestors(node_id))
+        found = []
+        for candidate in self.index.query(box):
+            if candidate == node_id or not overlaps(box, self.index.boxes[candidate]):
+                continue
+            if not include_nested and (
+                candidate in ancestors or node_id in self.ancestors(candidate)
+            ):
+                continue
+            found.append(self.describe(candidate))
+        return found
+
+
+def build_page_indexes(
+    document: dict[str, Any], bounds_key: str = "absoluteBoundingBox"
+) -> dict[str, PageIndex]:
+    return {
+        page.get("id"): PageIndex(page, bounds_key)
+        for page in document.get("children") or []
+    }
@@ -0,0 +1,174 @@
+"""Serving many Figma credentials from one process.
+
+``TenantPool`` keeps one ``FigmaApp`` per credential, each with its own HTTP
+client, caches and request budget, while version-pinned responses, which are
+identical for everyone allowed to read the file, go into one
+``SharedVersionCache``. A tenant is only served a shared entry after it has
+proven access to the file with its own credentials.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from universal_mcp_figma.app import FigmaApp
+from universal_mcp_figma.cache import TTLCache
+
+# How long a tenant's proven access to a file is trusted before re-checking.
+ACCESS_GRANT_TTL = 10 * 60
+
+
+class TokenBucket:
+    """A request budget refilled at ``rate`` requests per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes one token, waiting for the bucket to refill when it is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedVersionCache:
+    """Version-pinned responses shared across tenants, guarded by per-tenant access grants."""
+
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 256,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        # Entries are sized by their encoded response, since whole files can
+        # be hundreds of megabytes.
+        self.responses = TTLCache(ttl=ttl, max_entries=max_entries, max_bytes=max_bytes)
+        self.grants = TTLCache(ttl=ACCESS_GRANT_TTL, max_entries=100_000)
+
+    def get(
+        self,
+        tenant_id: str,
+        file_key: str,
+        key: Hashable,
+        verify_access: Callable[[], None],
+    ) -> Any:
+        """Returns a cached response, first verifying that the tenant may read the file.
+
+        ``verify_access`` is only called for a cached entry the tenant has not
+        been granted yet and must raise when the tenant cannot read the file.
+        """
+        response = self.responses.get(key)
+        if response is None:
+            return None
+        if (tenant_id, file_key) not in self.grants:
+            verify_access()
+            self.grant(tenant_id, file_key)
+        return response
+
+    def set(
+        self,
+        tenant_id: str,
+        file_key: str,
+        key: Hashable,
+        response: Any,
+        size: int = 0,
+    ) -> None:
+        # The tenant just read the file with its own credentials.
+        self.grant(tenant_id, file_key)
+        self.responses.set(key, response, size=size)
+
+    def grant(self, tenant_id: str, file_key: str) -> None:
+        self.grants.set((tenant_id, file_key), True)
+
+
+class StaticCredentials:
+    """An integration that always returns the same access token."""
+
+    def __init__(self, access_token: str) -> None:
+        self.access_token = access_token
+
+    def get_credentials(self) -> dict[str, str]:
+        return {"access_token": self.access_token}
+
+
+class TenantPool:
+    """Holds one ``FigmaApp`` per tenant, evicting the least recently used beyond ``max_tenants``.
+
+    Every tenant gets its own client and connection pool and a request budget of
+    ``rate`` requests per second with bursts of ``burst``, so one busy tenant
+    cannot exhaust another's Figma rate limit. Apps keep their on-disk caches
+    in a directory of their own under ``cache_dir``, so snapshots, usage graphs
+    and access tables are never read by another tenant.
+    """
+
+    def __init__(
+        self,
+        max_tenants: int = 100,
+        rate: float = 10.0,
+        burst: int = 20,
+        shared_cache: SharedVersionCache | None = None,
+        **app_kwargs: Any,
+    ) -> None:
+        self.max_tenants = max_tenants
+        self.rate = rate
+        self.burst = burst
+        self.shared_cache = shared_cache or SharedVersionCache()
+        self.app_kwargs = app_kwargs
+        self._apps: OrderedDict[str, FigmaApp] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, tenant_id: str, integration: Any = None, access_token: str | None = None
+    ) -> FigmaApp:
+        """Returns the app of a tenant, creating it from an integration or an access token."""
+        with self._lock:
+            app = self._apps.get(tenant_id)
+            if app is not None:
+                self._apps.move_to_end(tenant_id)
+                return app
+            if integration is None:
+                if access_token is None:
+                    raise ValueError(
+                        f"Tenant '{tenant_id}' needs an integration or an access token"
+                    )
+                integration = StaticCredentials(access_token)
+            app = FigmaApp(
+                integration=integration,
+                tenant_id=tenant_id,
+                rate_limit=TokenBucket(self.rate, self.burst),
+                shared_cache=self.shared_cache,
+                **self.app_kwargs,
+            )
+            self._apps[tenant_id] = app
+            while len(self._apps) > self.max_tenants:
+                _, evicted = self._apps.popitem(last=False)
+                evicted.close()
+            return app
+
+    def remove(self, tenant_id: str) -> None:
+        with self._lock:
+            app = self._apps.pop(tenant_id, None)
+        if app is not None:
+            app.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "tenants": len(self._apps),
+            "shared_responses": self.shared_cache.responses.stats(),
+            "access_grants": len(self.shared_cache.grants),
+        }
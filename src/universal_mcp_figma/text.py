@@ -0,0 +1,83 @@
+"""Extraction of text content from Figma documents for search indexing."""
+
+import hashlib
+from collections.abc import Container, Iterable, Iterator
+from typing import Any
+
+# Style properties that are useful to rank or facet text in a search index.
+TEXT_STYLE_KEYS = (
+    "fontFamily",
+    "fontPostScriptName",
+    "fontWeight",
+    "fontSize",
+    "italic",
+    "textCase",
+    "textDecoration",
+    "lineHeightPx",
+)
+
+
+def text_hash(characters: str) -> str:
+    return hashlib.sha1(characters.encode("utf-8")).hexdigest()
+
+
+def iter_text_nodes(document: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yields every TEXT node of a document in document order with its page and frame path.
+
+    The tree is walked with an explicit stack, so arbitrarily deep documents do
+    not hit the recursion limit and nodes are produced as they are reached.
+    """
+    stack: list[tuple[dict[str, Any], tuple[str, ...], str | None]] = [
+        (child, (), None) for child in reversed(document.get("children") or [])
+    ]
+    while stack:
+        node, path, page_id = stack.pop()
+        if page_id is None:
+            page_id = node.get("id")
+        if node.get("type") == "TEXT":
+            style = node.get("style") or {}
+            yield {
+                "node_id": node.get("id"),
+                "name": node.get("name"),
+                "page_id": page_id,
+                "path": list(path),
+                "characters": node.get("characters") or "",
+                "style": {key: style[key] for key in TEXT_STYLE_KEYS if key in style},
+            }
+            continue
+        children = node.get("children")
+        if children:
+            child_path = (*path, node.get("name"))
+            stack.extend((child, child_path, page_id) for child in reversed(children))
+
+
+def iter_text_batches(
+    files: Iterable[tuple[str, str | None, dict[str, Any]]],
+    batch_size: int = 500,
+    known: Container[str] = (),
+) -> Iterator[list[dict[str, Any]]]:
+    """Yields batches of text occurrence records for ``(file_key, version, document)`` triples.
+
+    Every record carries the hash of its text; the text itself is only included
+    the first time a hash is seen, so repeated strings are indexed once and
+    later occurrences reference them by hash. Hashes in ``known`` were indexed
+    by an earlier extraction and never carry their text.
+    """
+    seen: set[str] = set()
+    batch: list[dict[str, Any]] = []
+    for file_key, version, document in files:
+        for node in iter_text_nodes(document):
+            characters = node.pop("characters")
+            if not characters.strip():
+                continue
+            digest = text_hash(characters)
+            record = {"file_key": file_key, "version": version, "hash": digest, **node}
+            if digest not in seen and digest not in known:
+                seen.add(digest)
+                record["characters"] = characters
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,134 @@
+"""A persistent graph of where components are used across the files of a team."""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any
+
+
+def scan_component_usages(file: dict[str, Any]) -> dict[str, Any]:
+    """Returns the instances of every component in a file payload, keyed by component key and page ID.
+
+    Instances refer to their main component by a file-local ``componentId``;
+    the ``components`` map of the payload translates it to the component key,
+    which is stable across files.
+    """
+    components = file.get("components") or {}
+    usages: dict[str, dict[str, list[str]]] = {}
+    pages = {}
+    for page in (file.get("document") or {}).get("children") or []:
+        pages[page.get("id")] = page.get("name")
+        stack = list(page.get("children") or [])
+        while stack:
+            node = stack.pop()
+            if node.get("type") == "INSTANCE":
+                component = components.get(node.get("componentId")) or {}
+                if component.get("key"):
+                    usages.setdefault(component["key"], {}).setdefault(
+                        page.get("id"), []
+                    ).append(node.get("id"))
+            stack.extend(node.get("children") or [])
+    return {"pages": pages, "usages": usages}
+
+
+class ComponentUsageGraph:
+    """Maps main components to their instances per file and page, persisted as JSON.
+
+    Files are stored with the modification time they were scanned at, so a crawl
+    only needs to re-scan files that changed since. An in-memory reverse index
+    from component key to files answers usage queries without touching files
+    that do not use the component.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.files: dict[str, dict[str, Any]] = {}
+        self.components: dict[str, dict[str, Any]] = {}
+        self._by_component: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+            self.files = data.get("files") or {}
+            self.components = data.get("components") or {}
+            for file_key, entry in self.files.items():
+                self._index(file_key, entry)
+
+    def _index(self, file_key: str, entry: dict[str, Any]) -> None:
+        for component_key in entry.get("usages") or {}:
+            self._by_component.setdefault(component_key, set()).add(file_key)
+
+    def _unindex(self, file_key: str) -> None:
+        for component_key in (self.files.get(file_key) or {}).get("usages") or {}:
+            file_keys = self._by_component.get(component_key)
+            if file_keys is not None:
+                file_keys.discard(file_key)
+                if not file_keys:
+                    del self._by_component[component_key]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".", suffix=".tmp"
+        )
+        with self._lock:
+            data = {"files": self.files, "components": self.components}
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+    def is_current(self, file_key: str, last_modified: str | None) -> bool:
+        entry = self.files.get(file_key)
+        return entry is not None and entry.get("last_modified") == last_modified
+
+    def update_file(self, file_key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._unindex(file_key)
+            self.files[file_key] = entry
+            self._index(file_key, entry)
+
+    def remove_file(self, file_key: str) -> None:
+        with self._lock:
+            self._unindex(file_key)
+            self.files.pop(file_key, None)
+
+    def team_files(self, team_id: str) -> list[str]:
+        return [
+            key for key, entry in self.files.items() if entry.get("team_id") == team_id
+        ]
+
+    def usages(self, component_key: str) -> dict[str, Any]:
+        """Returns every instance of a component per file and page, with totals for impact analysis."""
+        files = []
+        for file_key in sorted(self._by_component.get(component_key, ())):
+            entry = self.files[file_key]
+            pages = entry["usages"][component_key]
+            files.append(
+                {
+                    "file_key": file_key,
+                    "name": entry.get("name"),
+                    "instances": sum(len(ids) for ids in pages.values()),
+                    "pages": [
+                        {
+                            "page_id": page_id,
+                            "name": (entry.get("pages") or {}).get(page_id),
+                            "instance_ids": ids,
+                        }
+                        for page_id, ids in pages.items()
+                    ],
+                }
+            )
+        files.sort(key=lambda file: file["instances"], reverse=True)
+        return {
+            "component": {
+                "key": component_key,
+                **self.components.get(component_key, {}),
+            },
+            "file_count": len(files),
+            "page_count": sum(len(file["pages"]) for file in files),
+            "instance_count": sum(file["instances"] for file in files),
+            "files": files,
+        }
@@ -0,0 +1,478 @@
+"""Resolution of Figma variables and their alias chains.
+
+The raw ``GET /v1/files/{file_key}/variables/local`` payload stores every value
+per mode, and a value may be a ``VARIABLE_ALIAS`` pointing at another variable,
+possibly in another collection. ``VariableResolver`` turns that payload into a
+graph of ``(variable_id, mode_id)`` nodes once and resolves all of them in a
+single topological pass, so later lookups are dictionary reads.
+"""
+
+import json
+from collections import deque
+from typing import Any
+
+ALIAS_TYPE = "VARIABLE_ALIAS"
+
+
+class VariableCycleError(ValueError):
+    """Raised when looking up a variable whose alias chain forms a cycle."""
+
+
+def is_alias(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("type") == ALIAS_TYPE
+
+
+class VariableResolver:
+    """Resolves every variable of a file for every mode of its collection.
+
+    Aliases into another collection are followed using the mode of the target
+    collection with the same name as the requesting mode, falling back to the
+    target collection's default mode, which mirrors what Figma does when no
+    explicit mode is set on a layer.
+    """
+
+    def __init__(self, payload: dict[str, Any], version: str | None = None) -> None:
+        meta = payload.get("meta", payload)
+        self.version = version
+        self.variables: dict[str, dict[str, Any]] = meta.get("variables") or {}
+        self.collections: dict[str, dict[str, Any]] = (
+            meta.get("variableCollections") or {}
+        )
+        self._by_name: dict[str, list[str]] = {}
+        for variable_id, variable in self.variables.items():
+            self._by_name.setdefault(variable.get("name"), []).append(variable_id)
+        self._resolved: dict[tuple[str, str], Any] = {}
+        self._chains: dict[tuple[str, str], list[str]] = {}
+        self.cycles: set[tuple[str, str]] = set()
+        self._resolve_all()
+
+    def _modes(self, collection_id: str) -> list[dict[str, Any]]:
+        return (self.collections.get(collection_id) or {}).get("modes") or []
+
+    def _mode_name(self, collection_id: str, mode_id: str) -> str | None:
+        for mode in self._modes(collection_id):
+            if mode.get("modeId") == mode_id:
+                return mode.get("name")
+        return None
+
+    def _target_mode(
+        self, source_collection: str, mode_id: str, target_collection: str
+    ) -> str | None:
+        target_modes = self._modes(target_collection)
+        if any(mode.get("modeId") == mode_id for mode in target_modes):
+            return mode_id
+        name = self._mode_name(source_collection, mode_id)
+        for mode in target_modes:
+            if name is not None and mode.get("name") == name:
+                return mode.get("modeId")
+        return (self.collections.get(target_collection) or {}).get("defaultModeId")
+
+    def _alias_target(
+        self, variable: dict[str, Any], mode_id: str, value: dict[str, Any]
+    ) -> tuple[str, str] | None:
+        target = self.variables.get(value.get("id"))
+        if target is None:
+            return None
+        target_mode = self._target_mode(
+            variable.get("variableCollectionId"),
+            mode_id,
+            target.get("variableCollectionId"),
+        )
+        if target_mode is None:
+            return None
+        return value["id"], target_mode
+
+    def _resolve_all(self) -> None:
+        # Each alias is an edge target -> source; Kahn's algorithm resolves the
+        # graph in dependency order and whatever is left over sits on a cycle.
+        dependants: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        pending: set[tuple[str, str]] = set()
+        queue: deque[tuple[str, str]] = deque()
+        for variable_id, variable in self.variables.items():
+            for mode_id, value in (variable.get("valuesByMode") or {}).items():
+                node = (variable_id, mode_id)
+                if is_alias(value):
+                    target = self._alias_target(variable, mode_id, value)
+                    if target is not None and self._has_value(target):
+                        dependants.setdefault(target, []).append(node)
+                        pending.add(node)
+                        continue
+                    # Dangling aliases resolve to the raw alias value.
+                    self._resolved[node] = value
+                    self._chains[node] = [variable_id]
+                else:
+                    self._resolved[node] = value
+                    self._chains[node] = [variable_id]
+                queue.append(node)
+        while queue:
+            node = queue.popleft()
+            for dependant in dependants.get(node, ()):
+                self._resolved[dependant] = self._resolved[node]
+                self._chains[dependant] = [dependant[0], *self._chains[node]]
+                pending.discard(dependant)
+                queue.append(dependant)
+        self.cycles = pending
+
+    def _has_value(self, node: tuple[str, str]) -> bool:
+        variable = self.variables.get(node[0]) or {}
+        return node[1] in (variable.get("valuesByMode") or {})
+
+    def find_variable(self, name: str, collection: str | None = None) -> str:
+        """Returns the id of the variable with the given id or name.
+
+        ``collection`` (a collection id or name) disambiguates variables that
+        share a name across collections.
+        """
+        if name in self.variables:
+            return name
+        candidates = self._by_name.get(name, [])
+        if collection is not None:
+            candidates = [
+                variable_id
+                for variable_id in candidates
+                if collection
+                in (
+                    self.variables[variable_id].get("variableCollectionId"),
+                    self._collection_name(variable_id),
+                )
+            ]
+        if not candidates:
+            raise KeyError(f"Unknown variable '{name}'")
+        if len(candidates) > 1:
+            raise KeyError(
+                f"Variable name '{name}' is ambiguous, pass the collection to disambiguate"
+            )
+        return candidates[0]
+
+    def _collection_name(self, variable_id: str) -> str | None:
+        collection_id = self.variables[variable_id].get("variableCollectionId")
+        return (self.collections.get(collection_id) or {}).get("name")
+
+    def find_mode(self, variable_id: str, mode: str | None = None) -> str:
+        """Returns the mode id for a mode id or name, defaulting to the default mode."""
+        collection_id = self.variables[variable_id].get("variableCollectionId")
+        collection = self.collections.get(collection_id) or {}
+        if mode is None:
+            return collection.get("defaultModeId")
+        for candidate in collection.get("modes") or []:
+            if mode in (candidate.get("modeId"), candidate.get("name")):
+                return candidate.get("modeId")
+        raise KeyError(f"Unknown mode '{mode}' for variable '{variable_id}'")
+
+    def resolve(
+        self, name: str, mode: str | None = None, collection: str | None = None
+    ) -> dict[str, Any]:
+        """Returns the resolved value of a variable in a mode along with its alias chain."""
+        variable_id = self.find_variable(name, collection)
+        mode_id = self.find_mode(variable_id, mode)
+        node = (variable_id, mode_id)
+        if node in self.cycles:
+            raise VariableCycleError(
+                f"Variable '{name}' has a cyclic alias chain in mode '{mode_id}'"
+            )
+        if node not in self._resolved:
+            raise KeyError(f"Variable '{name}' has no value in mode '{mode_id}'")
+        variable = self.variables[variable_id]
+        return {
+            "id": variable_id,
+            "name": variable.get("name"),
+            "collection": self._collection_name(variable_id),
+            "mode": self._mode_name(variable.get("variableCollectionId"), mode_id),
+            "modeId": mode_id,
+            "resolvedType": variable.get("resolvedType"),
+            "value": self._resolved[node],
+            "aliasChain": [
+                self.variables[chain_id].get("name") for chain_id in self._chains[node]
+            ],
+        }
+
+    def export_tokens(self) -> dict[str, Any]:
+        """Returns every resolved value grouped by collection name, mode name and variable name.
+
+        Values on a cyclic alias chain are reported under ``cycles`` instead.
+        """
+        tokens: dict[str, dict[str, dict[str, Any]]] = {}
+        cycles = []
+        for (variable_id, mode_id), value in self._resolved.items():
+            variable = self.variables[variable_id]
+            collection_id = variable.get("variableCollectionId")
+            collection_name = self._collection_name(variable_id) or collection_id
+            mode_name = self._mode_name(collection_id, mode_id) or mode_id
+            tokens.setdefault(collection_name, {}).setdefault(mode_name, {})[
+                variable.get("name")
+            ] = {"type": variable.get("resolvedType"), "value": value}
+        for variable_id, mode_id in sorted(self.cycles):
+            cycles.append(
+                {"name": self.variables[variable_id].get("name"), "modeId": mode_id}
+            )
+        return {"version": self.version, "tokens": tokens, "cycles": cycles}
+
+
+# POST /v1/files/{file_key}/variables rejects request bodies over 4MB; stay a
+# little under it to leave room for headers and encoding differences.
+MAX_VARIABLES_REQUEST_BYTES = 4 * 1024 * 1024 - 64 * 1024
+
+# The endpoint applies the arrays of a request in this order, so a batch that is
+# a contiguous slice of actions sorted by it is always dependency ordered.
+VARIABLE_CHANGE_KINDS = (
+    "variableCollections",
+    "variableModes",
+    "variables",
+    "variableModeValues",
+)
+
+VARIABLE_PROPERTIES = ("description", "hiddenFromPublishing", "scopes", "codeSyntax")
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    if isinstance(left, bool) or isinstance(right, bool):
+        return left is right
+    if isinstance(left, int | float) and isinstance(right, int | float):
+        return abs(left - right) <= 1e-6
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(
+            _same_value(left[key], right[key]) for key in left
+        )
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(
+            _same_value(a, b) for a, b in zip(left, right, strict=True)
+        )
+    return left == right
+
+
+class VariableChangePlanner:
+    """Computes the POST /variables actions that turn a file's current variables into a desired state.
+
+    The desired state maps collection names to their modes and variables::
+
+        {
+            "Theme": {
+                "modes": ["Light", "Dark"],
+                "variables": {
+                    "accent": {
+                        "resolvedType": "COLOR",
+                        "values": {
+                            "Light": {"r": 0, "g": 0, "b": 1, "a": 1},
+                            "Dark": {"type": "VARIABLE_ALIAS", "collection": "Primitives", "name": "blue/300"},
+                        },
+                    },
+                },
+            },
+        }
+
+    Aliases may reference variables by ``id`` or by ``collection`` and ``name``,
+    including variables that are created by the same sync. Collections, modes
+    and variables are matched by name and only differences produce actions.
+    """
+
+    def __init__(self, current: dict[str, Any], desired: dict[str, Any]) -> None:
+        meta = current.get("meta", current)
+        self.desired = desired
+        self.collections = {
+            collection.get("name"): collection
+            for collection in (meta.get("variableCollections") or {}).values()
+            if not collection.get("remote")
+        }
+        self.variables: dict[tuple[str, str], dict[str, Any]] = {}
+        for variable_id, variable in (meta.get("variables") or {}).items():
+            if variable.get("remote"):
+                continue
+            for name, collection in self.collections.items():
+                if collection.get("id") == variable.get("variableCollectionId"):
+                    self.variables[(name, variable.get("name"))] = {
+                        "id": variable_id,
+                        **variable,
+                    }
+        self.changes: dict[str, list[dict[str, Any]]] = {
+            kind: [] for kind in VARIABLE_CHANGE_KINDS
+        }
+        self._collection_ids: dict[str, str] = {}
+        self._mode_ids: dict[tuple[str, str], str] = {}
+        self._variable_ids: dict[tuple[str, str], str] = {}
+        self._temp_ids = 0
+
+    def _temp_id(self) -> str:
+        self._temp_ids += 1
+        return f"tmp:{self._temp_ids}"
+
+    def plan(self, delete_missing: bool = False) -> dict[str, list[dict[str, Any]]]:
+        for collection_name, spec in self.desired.items():
+            self._plan_collection(collection_name, spec)
+        for collection_name, spec in self.desired.items():
+            for variable_name, variable_spec in (spec.get("variables") or {}).items():
+                self._plan_variable(collection_name, variable_name, variable_spec)
+        for collection_name, spec in self.desired.items():
+            for variable_name, variable_spec in (spec.get("variables") or {}).items():
+                self._plan_values(collection_name, variable_name, variable_spec)
+        if delete_missing:
+            self._plan_deletes()
+        return self.changes
+
+    def _plan_collection(self, collection_name: str, spec: dict[str, Any]) -> None:
+        modes = list(spec.get("modes") or [])
+        current = self.collections.get(collection_name)
+        if current is None:
+            collection_id = self._temp_id()
+            action = {"action": "CREATE", "id": collection_id, "name": collection_name}
+            if spec.get("hiddenFromPublishing") is not None:
+                action["hiddenFromPublishing"] = spec["hiddenFromPublishing"]
+            self._collection_ids[collection_name] = collection_id
+            if modes:
+                # A new collection always starts with one mode; claim it for
+                # the first desired mode instead of creating an extra one.
+                initial_mode_id = self._temp_id()
+                action["initialModeId"] = initial_mode_id
+                self._mode_ids[(collection_name, modes[0])] = initial_mode_id
+                self.changes["variableModes"].append(
+                    {
+                        "action": "UPDATE",
+                        "id": initial_mode_id,
+                        "name": modes[0],
+                        "variableCollectionId": collection_id,
+                    }
+                )
+                modes = modes[1:]
+            self.changes["variableCollections"].append(action)
+        else:
+            collection_id = current["id"]
+            self._collection_ids[collection_name] = collection_id
+            for mode in current.get("modes") or []:
+                self._mode_ids[(collection_name, mode.get("name"))] = mode.get("modeId")
+        for mode_name in modes:
+            if (collection_name, mode_name) in self._mode_ids:
+                continue
+            mode_id = self._temp_id()
+            self._mode_ids[(collection_name, mode_name)] = mode_id
+            self.changes["variableModes"].append(
+                {
+                    "action": "CREATE",
+                    "id": mode_id,
+                    "name": mode_name,
+                    "variableCollectionId": collection_id,
+                }
+            )
+
+    def _plan_variable(
+        self, collection_name: str, variable_name: str, spec: dict[str, Any]
+    ) -> None:
+        current = self.variables.get((collection_name, variable_name))
+        properties = {key: spec[key] for key in VARIABLE_PROPERTIES if key in spec}
+        if current is None:
+            if spec.get("resolvedType") is None:
+                raise ValueError(
+                    f"Variable '{collection_name}/{variable_name}' needs a resolvedType to be created"
+                )
+            variable_id = self._temp_id()
+            self.changes["variables"].append(
+                {
+                    "action": "CREATE",
+                    "id": variable_id,
+                    "name": variable_name,
+                    "variableCollectionId": self._collection_ids[collection_name],
+                    "resolvedType": spec["resolvedType"],
+                    **properties,
+                }
+            )
+        else:
+            variable_id = current["id"]
+            resolved_type = spec.get("resolvedType")
+            if resolved_type is not None and resolved_type != current.get(
+                "resolvedType"
+            ):
+                raise ValueError(
+                    f"Variable '{collection_name}/{variable_name}' cannot change type "
+                    f"from {current.get('resolvedType')} to {resolved_type}"
+                )
+            changed = {
+                key: value
+                for key, value in properties.items()
+                if not _same_value(value, current.get(key))
+            }
+            if changed:
+                self.changes["variables"].append(
+                    {"action": "UPDATE", "id": variable_id, **changed}
+                )
+        self._variable_ids[(collection_name, variable_name)] = variable_id
+
+    def _alias(self, value: dict[str, Any]) -> dict[str, Any]:
+        if value.get("id") is not None:
+            return {"type": ALIAS_TYPE, "id": value["id"]}
+        key = (value.get("collection"), value.get("name"))
+        variable_id = self._variable_ids.get(key)
+        if variable_id is None and key in self.variables:
+            variable_id = self.variables[key]["id"]
+        if variable_id is None:
+            raise ValueError(f"Alias target '{key[0]}/{key[1]}' does not exist")
+        return {"type": ALIAS_TYPE, "id": variable_id}
+
+    def _plan_values(
+        self, collection_name: str, variable_name: str, spec: dict[str, Any]
+    ) -> None:
+        current = self.variables.get((collection_name, variable_name)) or {}
+        current_values = current.get("valuesByMode") or {}
+        variable_id = self._variable_ids[(collection_name, variable_name)]
+        for mode_name, value in (spec.get("values") or {}).items():
+            mode_id = self._mode_ids.get((collection_name, mode_name))
+            if mode_id is None:
+                raise ValueError(
+                    f"Mode '{mode_name}' is not declared for collection '{collection_name}'"
+                )
+            if is_alias(value):
+                value = self._alias(value)
+            if mode_id in current_values and _same_value(
+                value, current_values[mode_id]
+            ):
+                continue
+            self.changes["variableModeValues"].append(
+                {"variableId": variable_id, "modeId": mode_id, "value": value}
+            )
+
+    def _plan_deletes(self) -> None:
+        for (collection_name, variable_name), variable in self.variables.items():
+            spec = self.desired.get(collection_name)
+            if spec is None or variable_name in (spec.get("variables") or {}):
+                continue
+            self.changes["variables"].append({"action": "DELETE", "id": variable["id"]})
+
+
+def pack_variable_batches(
+    changes: dict[str, list[dict[str, Any]]],
+    max_bytes: int = MAX_VARIABLES_REQUEST_BYTES,
+) -> list[dict[str, list[dict[str, Any]]]]:
+    """Packs planned changes into as few request bodies as fit in ``max_bytes`` each.
+
+    Actions keep their global order, so every batch stays dependency ordered and
+    anything it references was either created earlier in the same batch or in a
+    previous one.
+    """
+    batches: list[dict[str, list[dict[str, Any]]]] = []
+    batch: dict[str, list[dict[str, Any]]] = {}
+    size = 2
+    for kind in VARIABLE_CHANGE_KINDS:
+        for action in changes.get(kind) or []:
+            action_size = len(json.dumps(action, separators=(",", ":"))) + 1
+            key_size = 0 if kind in batch else len(kind) + 4
+            if batch and size + key_size + action_size > max_bytes:
+                batches.append(batch)
+                batch, size, key_size = {}, 2, len(kind) + 4
+            batch.setdefault(kind, []).append(action)
+            size += key_size + action_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def replace_temp_ids(
+    batch: dict[str, list[dict[str, Any]]], mapping: dict[str, str]
+) -> None:
+    """Rewrites references to temporary IDs created by earlier batches to their real IDs."""
+    if not mapping:
+        return
+    for actions in batch.values():
+        for action in actions:
+            for key in ("id", "variableCollectionId", "variableId", "modeId"):
+                if action.get(key) in mapping:
+                    action[key] = mapping[action[key]]
+            value = action.get("value")
+            if is_alias(value) and value.get("id") in mapping:
+                action["value"] = {**value, "id": mapping[value["id"]]}
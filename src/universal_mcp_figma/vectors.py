@@ -0,0 +1,212 @@
+"""Local SVG export of vector geometry returned with ``geometry=paths``.
+
+Figma returns ``fillGeometry`` and ``strokeGeometry`` as path strings in the
+local coordinate space of each node, using only absolute ``M``, ``L``, ``Q``,
+``C`` and ``Z`` commands. Exporting a node means placing the paths of its
+descendants with the chain of their ``relativeTransform`` matrices and writing
+them as SVG, which avoids a render through the images endpoint. Groups have no
+coordinate space of their own: the ``relativeTransform`` of a group's children
+is relative to the nearest frame-like ancestor, as is the group's own.
+"""
+
+import re
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+# Number of coordinates consumed by each path command.
+COMMAND_ARITY = {"M": 2, "L": 2, "Q": 4, "C": 6, "Z": 0}
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+# Node types whose children are positioned in the space of the group's parent.
+GROUP_TYPES = frozenset({"GROUP", "BOOLEAN_OPERATION"})
+
+_TOKEN = re.compile(r"[MLQCZ]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+Matrix = tuple[float, float, float, float, float, float]
+
+
+def parse_path(path: str) -> tuple[list[tuple[str, int]], array]:
+    """Splits path data into ``(command, coordinate count)`` runs and one flat coordinate array."""
+    commands: list[tuple[str, int]] = []
+    coordinates = array("d")
+    command = None
+    pending = 0
+    for token in _TOKEN.findall(path):
+        if token in COMMAND_ARITY:
+            command = token
+            pending = COMMAND_ARITY[token]
+            commands.append((command, 0))
+            continue
+        if command is None or command == "Z":
+            raise ValueError(f"Unexpected coordinate in path data: {path[:40]}")
+        if pending == 0:
+            # Repeated coordinates continue the previous command; after M they mean L.
+            command = "L" if command == "M" else command
+            pending = COMMAND_ARITY[command]
+            commands.append((command, 0))
+        name, count = commands[-1]
+        commands[-1] = (name, count + 1)
+        coordinates.append(float(token))
+        pending -= 1
+    return commands, coordinates
+
+
+def to_matrix(relative_transform: list[list[float]] | None) -> Matrix:
+    """Converts a ``[[a, c, e], [b, d, f]]`` relativeTransform into an ``(a, b, c, d, e, f)`` matrix."""
+    if not relative_transform:
+        return IDENTITY
+    (a, c, e), (b, d, f) = relative_transform
+    return a, b, c, d, e, f
+
+
+def multiply(outer: Matrix, inner: Matrix) -> Matrix:
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (
+        a1 * a2 + c1 * b2,
+        b1 * a2 + d1 * b2,
+        a1 * c2 + c1 * d2,
+        b1 * c2 + d1 * d2,
+        a1 * e2 + c1 * f2 + e1,
+        b1 * e2 + d1 * f2 + f1,
+    )
+
+
+def invert(matrix: Matrix) -> Matrix:
+    a, b, c, d, e, f = matrix
+    determinant = a * d - b * c
+    if not determinant:
+        return IDENTITY
+    return (
+        d / determinant,
+        -b / determinant,
+        -c / determinant,
+        a / determinant,
+        (c * f - d * e) / determinant,
+        (b * e - a * f) / determinant,
+    )
+
+
+def transform(coordinates: array, matrix: Matrix) -> array:
+    """Applies an affine matrix to a flat ``x, y, x, y, ...`` coordinate array in one pass."""
+    if matrix == IDENTITY:
+        return coordinates
+    a, b, c, d, e, f = matrix
+    xs = coordinates[0::2]
+    ys = coordinates[1::2]
+    result = array("d", bytes(8 * len(coordinates)))
+    result[0::2] = array("d", [a * x + c * y + e for x, y in zip(xs, ys, strict=True)])
+    result[1::2] = array("d", [b * x + d * y + f for x, y in zip(xs, ys, strict=True)])
+    return result
+
+
+def _number(value: float, precision: int) -> str:
+    text = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+def format_path(
+    commands: list[tuple[str, int]], coordinates: array, precision: int = 2
+) -> str:
+    parts = []
+    offset = 0
+    for command, count in commands:
+        values = coordinates[offset : offset + count]
+        offset += count
+        parts.append(command + " ".join(_number(value, precision) for value in values))
+    return "".join(parts)
+
+
+def _color(paints: list[dict[str, Any]] | None) -> tuple[str, float] | None:
+    for paint in paints or []:
+        if paint.get("visible", True) and paint.get("type") == "SOLID":
+            color = paint.get("color") or {}
+            rgb = "#" + "".join(
+                f"{round(color.get(channel, 0) * 255):02x}"
+                for channel in ("r", "g", "b")
+            )
+            return rgb, color.get("a", 1) * paint.get("opacity", 1)
+    return None
+
+
+def iter_node_paths(
+    root: dict[str, Any], precision: int = 2
+) -> Iterator[dict[str, Any]]:
+    """Yields every visible fill and stroke path under ``root`` in root coordinates.
+
+    Transforms and layer opacity accumulate from the root down to each node,
+    with the transforms composed only through frame-like ancestors. A group
+    root maps its children out of its parent's space with the inverse of its own
+    ``relativeTransform``.
+    The geometry of a ``BOOLEAN_OPERATION`` is already the combined result of
+    its operands, so its children are not visited. Mask layers only clip their
+    siblings and are not painted; the clipping itself is not reproduced.
+    """
+    # Each entry carries the node's matrix and that of the space its children
+    # are positioned in, which is the parent's space for a group.
+    parent_space = invert(to_matrix(root.get("relativeTransform")))
+    stack: list[tuple[dict[str, Any], Matrix, Matrix, float]] = [
+        (root, IDENTITY, parent_space, 1.0)
+    ]
+    while stack:
+        node, matrix, parent_space, opacity = stack.pop()
+        if node.get("visible", True) is False or node.get("isMask"):
+            continue
+        opacity *= node.get("opacity", 1)
+        for geometry_key, paints_key in (
+            ("fillGeometry", "fills"),
+            ("strokeGeometry", "strokes"),
+        ):
+            color = _color(node.get(paints_key))
+            if color is None:
+                continue
+            for geometry in node.get(geometry_key) or []:
+                commands, coordinates = parse_path(geometry.get("path", ""))
+                yield {
+                    "node_id": node.get("id"),
+                    "d": format_path(
+                        commands, transform(coordinates, matrix), precision
+                    ),
+                    "fill": color[0],
+                    "opacity": color[1] * opacity,
+                    "fill_rule": (geometry.get("windingRule") or "NONZERO").lower(),
+                }
+        if node.get("type") == "BOOLEAN_OPERATION":
+            continue
+        space = parent_space if node.get("type") in GROUP_TYPES else matrix
+        stack.extend(
+            (
+                child,
+                multiply(space, to_matrix(child.get("relativeTransform"))),
+                space,
+                opacity,
+            )
+            for child in reversed(node.get("children") or [])
+        )
+
+
+def node_to_svg(root: dict[str, Any], precision: int = 2) -> str:
+    """Renders a node and its descendants as a standalone SVG document."""
+    # ``size`` is the unrotated size of the node, matching its local coordinates.
+    size = root.get("size")
+    if size:
+        width, height = size.get("x", 0), size.get("y", 0)
+    else:
+        bounds = root.get("absoluteBoundingBox") or {}
+        width, height = bounds.get("width", 0), bounds.get("height", 0)
+    width, height = _number(width, precision), _number(height, precision)
+    elements = []
+    for path in iter_node_paths(root, precision):
+        opacity = (
+            ""
+            if path["opacity"] >= 1
+            else f' fill-opacity="{_number(path["opacity"], 3)}"'
+        )
+        elements.append(
+            f'<path d="{path["d"]}" fill="{path["fill"]}"{opacity}'
+            f' fill-rule="{path["fill_rule"]}"/>'
+        )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
+        f' viewBox="0 0 {width} {height}" fill="none">' + "".join(elements) + "</svg>"
+    )
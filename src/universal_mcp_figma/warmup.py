@@ -0,0 +1,154 @@
+"""Access-frequency tracking and background cache prewarming."""
+
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AccessFrequencyTable:
+    """Exponentially decayed access counts per endpoint and file key, persisted as JSON.
+
+    A count halves every ``half_life`` seconds without access, so the table
+    favours files that are hot now over files that were hot last month.
+    """
+
+    def __init__(
+        self, path: str | None = None, half_life: float = 24 * 60 * 60
+    ) -> None:
+        self.path = path
+        self.half_life = half_life
+        self._scores: dict[tuple[str, str], tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for entry in json.load(file):
+                    key = (entry["endpoint"], entry["file_key"])
+                    self._scores[key] = (entry["score"], entry["updated"])
+
+    def _decayed(self, score: float, updated: float, now: float) -> float:
+        return score * math.pow(0.5, max(0.0, now - updated) / self.half_life)
+
+    def record(self, endpoint: str, file_key: str, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            score, updated = self._scores.get((endpoint, file_key), (0.0, now))
+            self._scores[(endpoint, file_key)] = (
+                self._decayed(score, updated, now) + 1,
+                now,
+            )
+
+    def top(self, n: int, now: float | None = None) -> list[tuple[str, str, float]]:
+        """Returns the ``n`` hottest ``(endpoint, file_key, score)`` entries."""
+        now = time.time() if now is None else now
+        with self._lock:
+            scored = [
+                (endpoint, file_key, self._decayed(score, updated, now))
+                for (endpoint, file_key), (score, updated) in self._scores.items()
+            ]
+        scored.sort(key=lambda entry: entry[2], reverse=True)
+        return scored[:n]
+
+    def prune(self, min_score: float = 0.01, now: float | None = None) -> None:
+        """Drops entries that have decayed below ``min_score`` to keep the table small."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._scores = {
+                key: (score, updated)
+                for key, (score, updated) in self._scores.items()
+                if self._decayed(score, updated, now) >= min_score
+            }
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            entries = [
+                {
+                    "endpoint": endpoint,
+                    "file_key": file_key,
+                    "score": score,
+                    "updated": updated,
+                }
+                for (endpoint, file_key), (score, updated) in self._scores.items()
+            ]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".", suffix=".tmp"
+        )
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+        os.replace(temporary, self.path)
+
+
+class WarmupScheduler:
+    """Prefetches the hottest entries of an access table at startup and then periodically.
+
+    ``needs_refresh(endpoint, file_key)`` decides whether an entry is missing or
+    about to expire from the cache, and ``prefetch(endpoint, file_key)`` fetches
+    it into the cache. Each run sends at most ``budget`` requests.
+    """
+
+    def __init__(
+        self,
+        table: AccessFrequencyTable,
+        prefetch: Callable[[str, str], Any],
+        needs_refresh: Callable[[str, str], bool],
+        top_n: int = 20,
+        budget: int = 50,
+        interval: float = 10 * 60,
+    ) -> None:
+        self.table = table
+        self.prefetch = prefetch
+        self.needs_refresh = needs_refresh
+        self.top_n = top_n
+        self.budget = budget
+        self.interval = interval
+        self.runs = 0
+        self.prefetched = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        requests = 0
+        for endpoint, file_key, _ in self.table.top(self.top_n):
+            if requests >= self.budget:
+                break
+            if not self.needs_refresh(endpoint, file_key):
+                continue
+            requests += 1
+            try:
+                self.prefetch(endpoint, file_key)
+            except Exception:
+                logger.warning(
+                    "Prefetching %s for %s failed", endpoint, file_key, exc_info=True
+                )
+        self.table.prune()
+        self.table.save()
+        self.runs += 1
+        self.prefetched += requests
+        return requests
+
+    def _run(self) -> None:
+        while True:
+            self.run_once()
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="figma-warmup", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.table.save()
@@ -0,0 +1,73 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, data=None, status_code=200, chunks=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = {}
+        self.chunks = chunks
+
+    @property
+    def content(self):
+        return json.dumps(self.data).encode("utf-8")
+
+    def iter_raw(self):
+        yield from self.chunks or [self.content]
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def figma(tmp_path):
+    """Returns a factory of apps whose requests are answered by ``handler(method, path, params, body)``.
+
+    The handler returns the response JSON, a ``FakeResponse`` or raises.
+    """
+    from universal_mcp_figma.app import FigmaApp
+
+    apps = []
+
+    def make(handler, **kwargs):
+        def respond(method, url, params=None, json=None, **_):
+            path = url.removeprefix("https://api.figma.com")
+            response = handler(method, path, dict(params or {}), json)
+            return (
+                response
+                if isinstance(response, FakeResponse)
+                else FakeResponse(response)
+            )
+
+        client = MagicMock()
+        client.request.side_effect = respond
+        # Requests made under a deadline are built first and then streamed.
+        client.build_request.side_effect = lambda method, url, **kw: (method, url, kw)
+        client.send.side_effect = lambda request, stream=False: respond(
+            request[0], request[1], **request[2]
+        )
+        for method in ("get", "post", "put", "delete"):
+            getattr(client, method).side_effect = (
+                lambda url, _method=method.upper(), **kw: client.request(
+                    _method, url, **kw
+                )
+            )
+        kwargs.setdefault("cache_dir", str(tmp_path / "cache"))
+        app = FigmaApp(integration=MagicMock(), **kwargs)
+        app._client = client
+        apps.append(app)
+        return app
+
+    yield make
+    for app in apps:
+        app.close()
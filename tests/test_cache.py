@@ -0,0 +1,74 @@
+from universal_mcp_figma import cache
+from universal_mcp_figma.cache import TTLCache
+
+
+def test_ttl_cache_expires_and_counts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    entries = TTLCache(ttl=10)
+    entries.set("a", 1)
+    assert entries.get("a") == 1
+    now[0] += 11
+    assert entries.get("a") is None
+    assert entries.stats() == {
+        "entries": 0,
+        "bytes": 0,
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    entries = TTLCache(ttl=60, max_entries=2)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.get("a")
+    entries.set("c", 3)
+    assert "a" in entries
+    assert "b" not in entries
+    assert len(entries) == 2
+
+
+def test_ttl_cache_caps_total_size():
+    entries = TTLCache(ttl=60, max_bytes=10)
+    entries.set("a", 1, size=4)
+    entries.set("b", 2, size=4)
+    entries.set("a", 3, size=5)
+    assert entries.bytes == 9
+    entries.set("c", 4, size=3)
+    assert "b" not in entries
+    assert entries.bytes == 8
+    entries.set("huge", 5, size=11)
+    assert "huge" not in entries
+    assert entries.pop("a") == 3
+    assert entries.bytes == 3
+
+
+def test_get_images_only_requests_missing_nodes(figma):
+    renders = []
+
+    def handler(method, path, params, body):
+        if path == "/v1/files/FILE":
+            return {"version": "7"}
+        renders.append(params)
+        ids = params["ids"].split(",")
+        return {
+            "err": None,
+            "images": {i: None if i == "9:9" else f"https://img/{i}" for i in ids},
+        }
+
+    app = figma(handler)
+    first = app.get_images("FILE", "1:1,9:9")
+    assert first["images"] == {"1:1": "https://img/1:1", "9:9": None}
+    assert renders[-1] == {"ids": "1:1,9:9", "version": "7"}
+
+    second = app.get_images("FILE", "1:1,2:2,9:9")
+    assert second["images"]["2:2"] == "https://img/2:2"
+    assert renders[-1] == {"ids": "2:2,9:9", "version": "7"}
+
+    app.get_images("FILE", "1:1,2:2")
+    assert len(renders) == 2
+    app.get_images("FILE", "1:1", scale=2)
+    assert renders[-1] == {"ids": "1:1", "version": "7", "scale": 2}
+    assert app.get_image_cache_stats()["hits"] == 3
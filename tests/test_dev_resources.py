@@ -0,0 +1,69 @@
+from universal_mcp_figma.dev_resources import chunked, diff_dev_resources
+
+
+def test_diff_dev_resources():
+    current = [
+        {"id": "1", "name": "Docs", "url": "https://a", "node_id": "1:1"},
+        {"id": "2", "name": "Old", "url": "https://b", "node_id": "1:1"},
+        {"id": "3", "name": "Stale", "url": "https://c", "node_id": "1:2"},
+    ]
+    desired = [
+        {"node_id": "1:1", "url": "https://a", "name": "Docs"},
+        {"node_id": "1:1", "url": "https://b", "name": "New"},
+        {"node_id": "1:3", "url": "https://d"},
+    ]
+    plan = diff_dev_resources("FILE", current, desired)
+    assert plan["create"] == [
+        {"name": "https://d", "url": "https://d", "file_key": "FILE", "node_id": "1:3"}
+    ]
+    assert plan["update"] == [{"id": "2", "name": "New"}]
+    assert plan["delete"] == ["3"]
+    assert plan["unchanged"] == ["1"]
+    assert diff_dev_resources("FILE", current, desired, prune=False)["delete"] == []
+    assert diff_dev_resources("FILE", current, current)["create"] == []
+
+
+def test_chunked():
+    assert chunked(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+
+
+def test_sync_dev_resources_batches_and_collects_errors(figma):
+    current = [
+        {"id": str(index), "name": "Old", "url": f"https://{index}", "node_id": "1:1"}
+        for index in range(4)
+    ]
+    sent = []
+
+    def handler(method, path, params, body):
+        sent.append((method, path, len((body or {}).get("dev_resources") or [])))
+        if method == "GET":
+            return {"dev_resources": current}
+        if method == "POST":
+            return {"links_created": body["dev_resources"], "errors": []}
+        if method == "PUT":
+            return {"links_updated": [], "errors": [{"id": "0", "error": "denied"}]}
+        if path.endswith("/3"):
+            raise ConnectionError("reset")
+        return {}
+
+    desired = [
+        {"node_id": "1:1", "url": "https://0", "name": "Renamed"},
+        {"node_id": "1:1", "url": "https://1", "name": "Old"},
+        {"node_id": "1:1", "url": "https://1", "name": "Old"},
+        *({"node_id": "2:1", "url": f"https://new/{index}"} for index in range(5)),
+    ]
+    result = figma(handler).sync_dev_resources("FILE", desired, batch_size=2)
+    assert [request for request in sent if request[0] == "POST"] == [
+        ("POST", "/v1/dev_resources", 2),
+        ("POST", "/v1/dev_resources", 2),
+        ("POST", "/v1/dev_resources", 1),
+    ]
+    assert result["created"] == 5
+    assert result["updated"] == 0
+    assert result["unchanged"] == 1
+    assert result["deleted"] == 1
+    assert result["requests"] == 1 + 3 + 1 + 2
+    assert result["errors"] == [
+        {"id": "0", "error": "denied"},
+        {"id": "3", "error": "reset"},
+    ]
@@ -0,0 +1,130 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from conftest import FakeResponse
+
+from universal_mcp_figma.latency import (
+    DEFAULT_HEDGED_ENDPOINTS,
+    LatencyTracker,
+    deadline,
+    endpoint_template,
+    remaining_time,
+)
+
+
+def test_endpoint_template():
+    assert (
+        endpoint_template("https://api.figma.com/v1/files/abc/nodes")
+        == "/v1/files/{}/nodes"
+    )
+    assert endpoint_template("https://api.figma.com/v1/images/abc") == "/v1/images/{}"
+    assert endpoint_template("https://api.figma.com/v1/me") == "/v1/me"
+
+
+def test_nested_deadlines_only_shorten():
+    assert remaining_time() is None
+    with deadline(10):
+        with deadline(60):
+            assert remaining_time() == pytest.approx(10, abs=1)
+        with deadline(1):
+            assert remaining_time() <= 1
+    assert remaining_time() is None
+
+
+def test_percentile_needs_enough_samples():
+    tracker = LatencyTracker(min_samples=10)
+    for value in range(9):
+        tracker.record("/v1/images/{}", value)
+    assert tracker.percentile("/v1/images/{}", 0.95) is None
+    for value in range(9, 100):
+        tracker.record("/v1/images/{}", value)
+    assert tracker.percentile("/v1/images/{}", 0.95) == 95
+    assert tracker.stats()["/v1/images/{}"]["samples"] == 100
+
+
+def hedging_app(figma, responses, **kwargs):
+    """An app hedging image requests whose n-th request sleeps and answers ``responses[n]``."""
+    lock = threading.Lock()
+    sent = []
+
+    def handler(method, path, params, body):
+        with lock:
+            index = len(sent)
+            sent.append(path)
+        seconds, answer = responses[index]
+        time.sleep(seconds)
+        if isinstance(answer, Exception):
+            raise answer
+        return {"images": {"1:1": answer}}
+
+    app = figma(handler, hedged_endpoints=["/v1/images/{}"], **kwargs)
+    for _ in range(20):
+        app._latency.record("/v1/images/{}", 0.01)
+    return app, sent
+
+
+def test_hedge_fires_after_p95_and_first_success_wins(figma):
+    rate_limit = MagicMock()
+    app, sent = hedging_app(
+        figma,
+        [(0.5, "primary"), (0, "hedge")],
+        image_cache_ttl=0,
+        rate_limit=rate_limit,
+    )
+    assert app.get_images("FILE", "1:1")["images"]["1:1"] == "hedge"
+    stats = app.get_request_latency_stats()
+    assert (stats["requests"], stats["hedged"], stats["hedge_wins"]) == (1, 1, 1)
+    assert rate_limit.acquire.call_count == 2
+
+
+def test_hedge_covers_failed_primary(figma):
+    app, _ = hedging_app(
+        figma, [(0.05, ConnectionError("reset")), (0.1, "hedge")], image_cache_ttl=0
+    )
+    assert app.get_images("FILE", "1:1")["images"]["1:1"] == "hedge"
+
+
+def test_hedging_enabled_uses_default_endpoints(figma):
+    app = figma(lambda method, path, params, body: {}, hedged_endpoints=True)
+    assert app.hedged_endpoints == DEFAULT_HEDGED_ENDPOINTS
+    assert figma(lambda method, path, params, body: {}).hedged_endpoints == frozenset()
+
+
+def test_hedges_stay_within_budget(figma):
+    app, sent = hedging_app(
+        figma, [(0.1, "primary"), (0, "hedge"), (0.1, "slow")], image_cache_ttl=0
+    )
+    app.get_images("FILE", "1:1")
+    assert app.get_images("FILE", "1:1")["images"]["1:1"] == "slow"
+    assert len(sent) == 3
+    assert app.get_request_latency_stats()["hedged"] == 1
+
+
+def test_deadline_bounds_whole_request(figma):
+    def trickle():
+        for chunk in [b"{}"] * 50:
+            time.sleep(0.01)
+            yield chunk
+
+    app = figma(lambda method, path, params, body: FakeResponse(chunks=trickle()))
+    with deadline(0.1), pytest.raises(TimeoutError, match="while reading"):
+        app.get_file("FILE")
+    with deadline(0), pytest.raises(TimeoutError, match="before requesting"):
+        app.get_me()
+
+
+def test_deadline_reaches_worker_threads(figma):
+    seen = []
+
+    def handler(method, path, params, body):
+        if method == "GET":
+            return {"dev_resources": [{"id": "1", "url": "u", "node_id": "1:1"}]}
+        seen.append(remaining_time())
+        return {}
+
+    app = figma(handler)
+    with deadline(30):
+        assert app.sync_dev_resources("FILE", [])["deleted"] == 1
+    assert seen and seen[0] is not None
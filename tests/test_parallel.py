@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_figma import parallel
+from universal_mcp_figma.parallel import create_pool, process_document
+
+
+def frame(index):
+    return {
+        "id": f"{index}:0",
+        "type": "FRAME",
+        "name": f"Frame {index}",
+        "children": [
+            {"id": f"{index}:1", "type": "INSTANCE", "componentId": "C:1"},
+            {"id": f"{index}:2", "type": "TEXT", "characters": f"Label {index}"},
+        ],
+    }
+
+
+@pytest.fixture
+def document():
+    return {
+        "id": "0:0",
+        "type": "DOCUMENT",
+        "children": [
+            {
+                "id": "0:1",
+                "type": "CANVAS",
+                "name": "Page",
+                "children": [frame(i) for i in range(1, 9)],
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with create_pool(2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("task", sorted(parallel.TASKS))
+def test_parallel_matches_serial(document, pool, monkeypatch, task):
+    def normalized(result):
+        if task == "text":
+            return sorted(result, key=lambda record: record["node_id"])
+        return result
+
+    serial = process_document(document, task, max_workers=1)
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_BYTES", 0)
+    monkeypatch.setattr(parallel, "PARALLEL_TASKS", frozenset(parallel.TASKS))
+    parallel_result = process_document(document, task, max_workers=2, executor=pool)
+    assert normalized(parallel_result) == normalized(serial)
+
+
+def test_creates_pool_when_none_is_given(document, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_BYTES", 0)
+    hashes = process_document(document, "subtree_hash", max_workers=2)
+    assert hashes == process_document(document, "subtree_hash", max_workers=1)
+
+
+def test_cheap_tasks_stay_in_the_calling_process(document, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_BYTES", 0)
+    executor = MagicMock()
+    usage = process_document(
+        document, "component_usage", max_workers=2, executor=executor
+    )
+    assert len(usage["C:1"]) == 8
+    executor.map.assert_not_called()
+
+
+def test_results(document):
+    index = process_document(document, "index", max_workers=1)
+    assert index["3:1"] == {
+        "type": "INSTANCE",
+        "name": None,
+        "parent": "3:0",
+        "page": "0:1",
+    }
+    assert index["0:1"]["parent"] == "0:0"
+    usage = process_document(document, "component_usage", max_workers=1)
+    assert len(usage["C:1"]) == 8
+    hashes = process_document(document, "subtree_hash", max_workers=1)
+    assert hashes["1:0"] != hashes["2:0"]
+    assert len(process_document(document, "text", max_workers=1)) == 8
+    with pytest.raises(ValueError):
+        process_document(document, "unknown")
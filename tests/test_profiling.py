@@ -0,0 +1,56 @@
+import json
+import os
+import time
+
+from universal_mcp_figma.profiling import ToolProfiler, classify
+
+
+def test_classify_phases():
+    root = [("/app/server.py", "handle", 1)]
+    assert classify(root) == "compute"
+    assert classify(root + [("/site-packages/httpx/_client.py", "get", 3)]) == "request"
+    assert (
+        classify(
+            root
+            + [("/site-packages/httpx/_models.py", "json", 3)]
+            + [("/usr/lib/python3.11/json/decoder.py", "decode", 9)]
+        )
+        == "decode"
+    )
+    assert classify(root + [("/x/profiling.py", "serialize_result", 2)]) == "serialize"
+
+
+def test_profiles_kept_for_selected_and_slow_calls(tmp_path):
+    def slow():
+        time.sleep(0.05)
+        return {"ok": True}
+
+    profiler = ToolProfiler(
+        str(tmp_path), tools=["selected"], threshold=0.03, interval=0.005
+    )
+    assert profiler.call("selected", lambda: 1) == 1
+    assert profiler.call("fast", lambda: 2) == 2
+    assert profiler.call("slow", slow) == {"ok": True}
+    assert [profile["tool"] for profile in profiler.profiles] == ["selected", "slow"]
+    profile = profiler.profiles[-1]
+    assert profile["samples"] > 0
+    with open(profile["path"]) as file:
+        speedscope = json.load(file)
+    assert speedscope["profiles"][0]["type"] == "sampled"
+    assert speedscope["shared"]["frames"][0]["name"].startswith("phase:")
+
+
+def test_profile_files_rotate_with_history(tmp_path):
+    profiler = ToolProfiler(str(tmp_path), tools=["*"], history=2)
+    for _ in range(3):
+        profiler.call("tool", lambda: 1)
+    kept = sorted(os.path.basename(profile["path"]) for profile in profiler.profiles)
+    assert sorted(os.listdir(tmp_path)) == kept
+
+
+def test_unencodable_result_does_not_fail_the_call(tmp_path):
+    circular = {}
+    circular["self"] = circular
+    profiler = ToolProfiler(str(tmp_path), tools=["*"])
+    assert profiler.call("circular", lambda: circular) is circular
+    assert profiler.profiles[-1]["phases"]["serialize"] is None
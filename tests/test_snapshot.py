@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from universal_mcp_figma.snapshot import Snapshot, SnapshotError, write_snapshot
+
+PAYLOAD = {
+    "name": "Design system",
+    "version": "123",
+    "components": {"1:2": {"key": "abc", "name": "Button"}},
+    "document": {
+        "id": "0:0",
+        "name": "Document",
+        "type": "DOCUMENT",
+        "children": [
+            {
+                "id": "0:1",
+                "name": "Page 1",
+                "type": "CANVAS",
+                "backgroundColor": {"r": 1, "g": 1, "b": 1, "a": 1},
+                "children": [
+                    {
+                        "id": "1:1",
+                        "name": "Frame",
+                        "type": "FRAME",
+                        "children": [
+                            {"id": "1:2", "name": "Button", "type": "COMPONENT"},
+                            {
+                                "id": "1:3",
+                                "name": "Ünïcode",
+                                "type": "TEXT",
+                                "characters": "Hi",
+                            },
+                        ],
+                    }
+                ],
+            },
+            {"id": "0:2", "name": "Page 2", "type": "CANVAS", "children": []},
+        ],
+    },
+}
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "file.figsnap")
+    assert write_snapshot(PAYLOAD, path) == 6
+    with Snapshot(path) as snapshot:
+        assert snapshot.meta["version"] == "123"
+        assert snapshot.root.to_dict() == PAYLOAD["document"] | {
+            "children": [
+                PAYLOAD["document"]["children"][0],
+                {"id": "0:2", "name": "Page 2", "type": "CANVAS"},
+            ]
+        }
+        node = snapshot.find("1:3")
+        assert node.name == "Ünïcode"
+        assert node["characters"] == "Hi"
+        assert node.parent.id == "1:1"
+        assert [child.id for child in node.parent.children] == ["1:2", "1:3"]
+        assert snapshot.find("9:9") is None
+        assert snapshot.root.to_dict(depth=0) == {
+            "id": "0:0",
+            "name": "Document",
+            "type": "DOCUMENT",
+        }
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"{}" * 64)
+    with pytest.raises(SnapshotError):
+        Snapshot(str(path))
+
+
+def test_app_follows_the_current_version_and_prunes_old_snapshots(figma):
+    current = {"version": "123"}
+    app = figma(lambda method, path, params, body: PAYLOAD | current)
+    assert app.snapshot_file("FILE")["version"] == "123"
+    directory = os.path.join(app.cache_dir, "snapshots")
+    assert os.listdir(directory) == ["FILE@123.figsnap"]
+
+    current["version"] = "124"
+    app._file_versions.pop("FILE")
+    assert app.snapshot_file("FILE")["version"] == "124"
+    assert os.listdir(directory) == ["FILE@124.figsnap"]
@@ -0,0 +1,66 @@
+import random
+
+from universal_mcp_figma.spatial import PageIndex, SpatialIndex, intersects
+
+
+def box(node_id, x, y, width, height, children=()):
+    return {
+        "id": node_id,
+        "name": node_id,
+        "type": "FRAME",
+        "absoluteBoundingBox": {"x": x, "y": y, "width": width, "height": height},
+        "children": list(children),
+    }
+
+
+def test_query_matches_linear_scan():
+    rng = random.Random(7)
+    entries = []
+    for index in range(2000):
+        x, y = rng.uniform(0, 5000), rng.uniform(0, 5000)
+        entries.append(
+            ((x, y, x + rng.uniform(1, 200), y + rng.uniform(1, 200)), str(index))
+        )
+    spatial = SpatialIndex(entries)
+    for _ in range(50):
+        x, y = rng.uniform(0, 5000), rng.uniform(0, 5000)
+        region = (x, y, x + 300, y + 300)
+        expected = {item for entry, item in entries if intersects(entry, region)}
+        assert set(spatial.query(region)) == expected
+
+
+def test_page_index_overlaps_skip_nesting():
+    page = {
+        "id": "0:1",
+        "name": "Page",
+        "children": [
+            box("1:1", 0, 0, 100, 100, [box("1:2", 10, 10, 20, 20)]),
+            box("2:1", 50, 50, 100, 100),
+            box("3:1", 500, 500, 10, 10),
+        ],
+    }
+    index = PageIndex(page)
+    assert [node["id"] for node in index.find_overlaps("1:1")] == ["2:1"]
+    nested = {node["id"] for node in index.find_overlaps("1:1", include_nested=True)}
+    assert nested == {"1:2", "2:1"}
+    contained = index.query_region((0, 0, 120, 120), mode="contains")
+    assert {node["id"] for node in contained} == {"1:1", "1:2"}
+    assert contained[0]["width"] in (100, 20)
+    assert SpatialIndex([]).query((0, 0, 1, 1)) == []
+
+
+def test_touching_siblings_do_not_overlap():
+    page = {
+        "id": "0:1",
+        "name": "Page",
+        "children": [
+            box("a", 0, 0, 40, 40),
+            box("b", 40, 0, 40, 40),
+            box("c", 80, 0, 40, 40),
+        ],
+    }
+    index = PageIndex(page)
+    assert index.find_overlaps("b") == []
+    # Region queries still include nodes on the region's edge.
+    touching = index.query_region((40, 0, 80, 40))
+    assert {node["id"] for node in touching} == {"a", "b", "c"}
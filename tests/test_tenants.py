@@ -0,0 +1,110 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from conftest import FakeResponse
+
+from universal_mcp_figma.tenants import SharedVersionCache, TenantPool, TokenBucket
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=100, burst=2)
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+    # The third token has to be refilled, which takes 1 / rate seconds.
+    assert time.monotonic() - start >= 0.009
+
+
+def test_shared_cache_checks_access_once_per_tenant():
+    cache = SharedVersionCache()
+    cache.set("alice", "FILE", ("get_file", "FILE", "v1"), {"document": {}})
+    verify = MagicMock()
+    assert cache.get("alice", "FILE", ("get_file", "FILE", "v1"), verify) == {
+        "document": {}
+    }
+    verify.assert_not_called()
+    assert cache.get("bob", "FILE", ("get_file", "FILE", "v1"), verify) == {
+        "document": {}
+    }
+    assert cache.get("bob", "FILE", ("get_file", "FILE", "v1"), verify) == {
+        "document": {}
+    }
+    verify.assert_called_once()
+
+    denied = MagicMock(side_effect=PermissionError)
+    with pytest.raises(PermissionError):
+        cache.get("eve", "FILE", ("get_file", "FILE", "v1"), denied)
+    assert cache.get("eve", "FILE", ("get_file", "FILE", "v2"), denied) is None
+
+
+def test_shared_cache_is_capped_by_response_size():
+    cache = SharedVersionCache(max_bytes=100)
+    cache.set("alice", "FILE", "v1", {"document": {}}, size=60)
+    cache.set("alice", "FILE", "v2", {"document": {}}, size=60)
+    assert cache.responses.stats()["bytes"] == 60
+    assert cache.get("alice", "FILE", "v1", MagicMock()) is None
+    cache.set("alice", "FILE", "huge", {"document": {}}, size=101)
+    assert cache.get("alice", "FILE", "huge", MagicMock()) is None
+
+
+def test_pool_isolates_tenants_and_evicts(tmp_path):
+    pool = TenantPool(max_tenants=2, cache_dir=str(tmp_path))
+    alice = pool.get("alice", access_token="a")
+    assert pool.get("alice") is alice
+    bob = pool.get("bob", integration=MagicMock())
+    assert bob.rate_limit is not alice.rate_limit
+    assert bob.shared_cache is alice.shared_cache
+    pool.get("carol", access_token="c")
+    assert pool.stats()["tenants"] == 2
+    with pytest.raises(ValueError):
+        pool.get("alice")
+
+
+def test_denied_tenant_cannot_read_another_tenants_snapshot(tmp_path):
+    document = {
+        "id": "0:0",
+        "children": [{"id": "0:1", "type": "CANVAS", "children": []}],
+    }
+
+    def client(status):
+        fake = MagicMock()
+        fake.request.side_effect = lambda method, url, **_: FakeResponse(
+            {"version": "1", "document": document}, status_code=status
+        )
+        return fake
+
+    pool = TenantPool(cache_dir=str(tmp_path))
+    alice = pool.get("alice", access_token="a")
+    alice._client = client(200)
+    assert alice.snapshot_file("FILE", version="1")["node_count"] == 2
+    eve = pool.get("eve", access_token="e")
+    eve._client = client(403)
+    assert eve.cache_dir != alice.cache_dir
+    with pytest.raises(RuntimeError, match="403"):
+        eve.get_snapshot_node("FILE", "0:1", version="1")
+    eve._client.request.assert_called()
+
+
+def test_tenant_cannot_traverse_into_another_tenants_snapshots(tmp_path):
+    fake = MagicMock()
+    fake.request.side_effect = lambda method, url, **_: FakeResponse(
+        {"version": "1", "document": {"id": "0:0", "children": []}}
+    )
+    pool = TenantPool(cache_dir=str(tmp_path))
+    alice = pool.get("alice", access_token="a")
+    alice._client = fake
+    alice.snapshot_file("FILE", version="1")
+    eve = pool.get("eve", access_token="e")
+    eve._client = MagicMock()
+    other = os.path.basename(alice.cache_dir)
+    for file_key, version in (
+        (f"../../{other}/snapshots/FILE", "1"),
+        ("FILE", "1/../../x"),
+        ("..", "1"),
+    ):
+        with pytest.raises(ValueError, match="Invalid"):
+            eve.get_snapshot_node(file_key, "0:0", version=version)
+    eve._client.request.assert_not_called()
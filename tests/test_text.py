@@ -0,0 +1,98 @@
+from universal_mcp_figma.text import iter_text_batches, iter_text_nodes, text_hash
+
+
+def text(node_id, characters):
+    return {
+        "id": node_id,
+        "type": "TEXT",
+        "name": characters,
+        "characters": characters,
+        "style": {"fontFamily": "Inter", "fontSize": 12, "fills": []},
+    }
+
+
+DOCUMENT = {
+    "id": "0:0",
+    "type": "DOCUMENT",
+    "children": [
+        {
+            "id": "0:1",
+            "type": "CANVAS",
+            "name": "Page 1",
+            "children": [
+                {
+                    "id": "1:1",
+                    "type": "FRAME",
+                    "name": "Hero",
+                    "children": [text("1:2", "Hello"), text("1:3", "Sign up")],
+                },
+                text("1:4", "Hello"),
+            ],
+        }
+    ],
+}
+
+
+def test_iter_text_nodes_tracks_paths():
+    nodes = list(iter_text_nodes(DOCUMENT))
+    assert [node["node_id"] for node in nodes] == ["1:2", "1:3", "1:4"]
+    assert nodes[0]["path"] == ["Page 1", "Hero"]
+    assert nodes[2]["path"] == ["Page 1"]
+    assert nodes[0]["page_id"] == "0:1"
+    assert nodes[0]["style"] == {"fontFamily": "Inter", "fontSize": 12}
+
+
+def test_iter_text_batches_dedupes_text():
+    batches = list(iter_text_batches([("F", "1", DOCUMENT)], batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    last = batches[1][0]
+    assert last["hash"] == text_hash("Hello")
+    assert "characters" not in last
+    assert batches[0][0]["characters"] == "Hello"
+
+
+def test_extract_text_content_pages_with_cursor(figma):
+    versions = {"A": "1", "B": "1"}
+
+    def handler(method, path, params, body):
+        file_key = path.split("/")[3]
+        return {"version": versions[file_key], "document": DOCUMENT}
+
+    app = figma(handler)
+    first = app.extract_text_content("A,B", batch_size=2, max_batches=1)
+    assert first["versions"] == {"A": "1", "B": "1"}
+    assert len(first["batches"]) == 1
+    records = [record for batch in first["batches"] for record in batch]
+    cursor = first["cursor"]
+    while cursor is not None:
+        page = app.extract_text_content(cursor=cursor, max_batches=1)
+        records.extend(record for batch in page["batches"] for record in batch)
+        cursor = page["cursor"]
+    assert len(records) == 6
+    assert sum("characters" in record for record in records) == 2
+    assert app._text_versions == {"A": "1", "B": "1"}
+
+    versions["B"] = "2"
+    again = app.extract_text_content(["A", "B"])
+    assert again["skipped"] == ["A"]
+    assert again["cursor"] is None
+    assert not any(
+        "characters" in record for batch in again["batches"] for record in batch
+    )
+
+
+def test_abandoned_cursor_does_not_lose_peeked_texts(figma):
+    app = figma(
+        lambda method, path, params, body: {"version": "1", "document": DOCUMENT}
+    )
+    first = app.extract_text_content("A", batch_size=1, max_batches=1)
+    assert first["cursor"] is not None
+    assert [record["characters"] for record in first["batches"][0]] == ["Hello"]
+    assert app._text_versions == {}
+
+    # The cursor is dropped; the batch peeked behind it was never returned.
+    again = app.extract_text_content("A", batch_size=1)
+    assert again["skipped"] == []
+    records = [record for batch in again["batches"] for record in batch]
+    assert [record.get("characters") for record in records] == [None, "Sign up", None]
+    assert app._text_versions == {"A": "1"}
@@ -0,0 +1,55 @@
+from universal_mcp_figma.usage import ComponentUsageGraph, scan_component_usages
+
+FILE = {
+    "version": "7",
+    "components": {"10:1": {"key": "button", "name": "Button"}},
+    "document": {
+        "children": [
+            {
+                "id": "0:1",
+                "name": "Checkout",
+                "children": [
+                    {
+                        "id": "1:1",
+                        "type": "FRAME",
+                        "children": [
+                            {"id": "1:2", "type": "INSTANCE", "componentId": "10:1"},
+                            {"id": "1:3", "type": "INSTANCE", "componentId": "99:9"},
+                        ],
+                    },
+                    {"id": "1:4", "type": "INSTANCE", "componentId": "10:1"},
+                ],
+            }
+        ]
+    },
+}
+
+
+def test_scan_component_usages():
+    scanned = scan_component_usages(FILE)
+    assert scanned["pages"] == {"0:1": "Checkout"}
+    assert sorted(scanned["usages"]["button"]["0:1"]) == ["1:2", "1:4"]
+    assert list(scanned["usages"]) == ["button"]
+
+
+def test_graph_persists_and_updates_incrementally(tmp_path):
+    path = str(tmp_path / "usage.json")
+    graph = ComponentUsageGraph(path)
+    graph.update_file(
+        "F1", {"team_id": "T", "last_modified": "a", **scan_component_usages(FILE)}
+    )
+    graph.update_file(
+        "F2", {"team_id": "T", "last_modified": "b", **scan_component_usages(FILE)}
+    )
+    graph.save()
+
+    reloaded = ComponentUsageGraph(path)
+    assert reloaded.is_current("F1", "a")
+    assert not reloaded.is_current("F1", "c")
+    usages = reloaded.usages("button")
+    assert (usages["file_count"], usages["instance_count"]) == (2, 4)
+
+    reloaded.update_file("F1", {"team_id": "T", "last_modified": "c", "usages": {}})
+    reloaded.remove_file("F2")
+    assert reloaded.usages("button")["file_count"] == 0
+    assert reloaded.team_files("T") == ["F1"]
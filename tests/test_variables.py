@@ -0,0 +1,240 @@
+import json
+
+import pytest
+
+from universal_mcp_figma.variables import (
+    VariableChangePlanner,
+    VariableCycleError,
+    VariableResolver,
+    pack_variable_batches,
+    replace_temp_ids,
+)
+
+
+def alias(variable_id):
+    return {"type": "VARIABLE_ALIAS", "id": variable_id}
+
+
+@pytest.fixture
+def payload():
+    return {
+        "status": 200,
+        "meta": {
+            "variableCollections": {
+                "C:1": {
+                    "id": "C:1",
+                    "name": "Primitives",
+                    "defaultModeId": "1:0",
+                    "modes": [{"modeId": "1:0", "name": "Value"}],
+                },
+                "C:2": {
+                    "id": "C:2",
+                    "name": "Theme",
+                    "defaultModeId": "2:0",
+                    "modes": [
+                        {"modeId": "2:0", "name": "Light"},
+                        {"modeId": "2:1", "name": "Dark"},
+                    ],
+                },
+            },
+            "variables": {
+                "V:1": {
+                    "name": "blue/500",
+                    "variableCollectionId": "C:1",
+                    "resolvedType": "COLOR",
+                    "valuesByMode": {"1:0": {"r": 0, "g": 0, "b": 1, "a": 1}},
+                },
+                "V:2": {
+                    "name": "gray/900",
+                    "variableCollectionId": "C:1",
+                    "resolvedType": "COLOR",
+                    "valuesByMode": {"1:0": {"r": 0.1, "g": 0.1, "b": 0.1, "a": 1}},
+                },
+                "V:3": {
+                    "name": "accent",
+                    "variableCollectionId": "C:2",
+                    "resolvedType": "COLOR",
+                    "valuesByMode": {"2:0": alias("V:1"), "2:1": alias("V:2")},
+                },
+                "V:4": {
+                    "name": "button/bg",
+                    "variableCollectionId": "C:2",
+                    "resolvedType": "COLOR",
+                    "valuesByMode": {"2:0": alias("V:3"), "2:1": alias("V:3")},
+                },
+                "V:5": {
+                    "name": "loop/a",
+                    "variableCollectionId": "C:2",
+                    "resolvedType": "FLOAT",
+                    "valuesByMode": {"2:0": alias("V:6"), "2:1": 1},
+                },
+                "V:6": {
+                    "name": "loop/b",
+                    "variableCollectionId": "C:2",
+                    "resolvedType": "FLOAT",
+                    "valuesByMode": {"2:0": alias("V:5"), "2:1": 2},
+                },
+            },
+        },
+    }
+
+
+def test_resolves_alias_chain_across_collections(payload):
+    resolver = VariableResolver(payload, version="42")
+    light = resolver.resolve("button/bg")
+    dark = resolver.resolve("button/bg", mode="Dark")
+    assert light["value"] == {"r": 0, "g": 0, "b": 1, "a": 1}
+    assert light["aliasChain"] == ["button/bg", "accent", "blue/500"]
+    assert dark["value"]["r"] == 0.1
+    assert dark["mode"] == "Dark"
+
+
+def test_detects_cycles(payload):
+    resolver = VariableResolver(payload)
+    assert resolver.cycles == {("V:5", "2:0"), ("V:6", "2:0")}
+    with pytest.raises(VariableCycleError):
+        resolver.resolve("loop/a", mode="Light")
+    assert resolver.resolve("loop/a", mode="Dark")["value"] == 1
+
+
+def test_export_tokens(payload):
+    exported = VariableResolver(payload, version="42").export_tokens()
+    assert exported["version"] == "42"
+    assert exported["tokens"]["Theme"]["Dark"]["accent"]["value"]["g"] == 0.1
+    assert "loop/a" not in exported["tokens"]["Theme"]["Light"]
+    assert len(exported["cycles"]) == 2
+
+
+def test_app_resolver_tracks_current_version(figma, payload):
+    state = {"version": "1", "fetches": 0}
+
+    def handler(method, path, params, body):
+        if path == "/v1/files/FILE":
+            return {"version": state["version"]}
+        state["fetches"] += 1
+        return payload
+
+    app = figma(handler)
+    assert app.resolve_variable("FILE", "accent")["version"] == "1"
+    assert app.export_variable_tokens("FILE", version="1")["version"] == "1"
+    assert state["fetches"] == 1
+    with pytest.raises(ValueError, match="current version '1'"):
+        app.resolve_variable("FILE", "accent", version="0")
+
+    state["version"] = "2"
+    app._file_versions.clear()
+    assert app.resolve_variable("FILE", "accent")["version"] == "2"
+    assert state["fetches"] == 2
+
+
+def test_planner_only_emits_changes(payload):
+    desired = {
+        "Theme": {
+            "modes": ["Light", "Dark", "High contrast"],
+            "variables": {
+                "accent": {
+                    "resolvedType": "COLOR",
+                    "values": {"Light": alias("V:1"), "Dark": alias("V:1")},
+                },
+                "spacing": {
+                    "resolvedType": "FLOAT",
+                    "values": {"Light": 4, "High contrast": 8},
+                },
+            },
+        },
+        "Brand": {
+            "modes": ["Default"],
+            "variables": {
+                "logo": {
+                    "resolvedType": "COLOR",
+                    "values": {
+                        "Default": {
+                            "type": "VARIABLE_ALIAS",
+                            "collection": "Theme",
+                            "name": "accent",
+                        }
+                    },
+                }
+            },
+        },
+    }
+    changes = VariableChangePlanner(payload, desired).plan()
+    assert [c["name"] for c in changes["variableCollections"]] == ["Brand"]
+    assert [(m["action"], m["name"]) for m in changes["variableModes"]] == [
+        ("CREATE", "High contrast"),
+        ("UPDATE", "Default"),
+    ]
+    assert [v["name"] for v in changes["variables"]] == ["spacing", "logo"]
+    values = changes["variableModeValues"]
+    assert {"variableId": "V:3", "modeId": "2:1", "value": alias("V:1")} in values
+    assert not any(v["variableId"] == "V:3" and v["modeId"] == "2:0" for v in values)
+    assert values[-1]["value"] == alias("V:3")
+
+
+def test_pack_batches_respects_size_and_order():
+    changes = {
+        "variableCollections": [{"action": "CREATE", "id": "tmp:1", "name": "A"}],
+        "variables": [
+            {"action": "CREATE", "id": f"tmp:{i}", "variableCollectionId": "tmp:1"}
+            for i in range(2, 50)
+        ],
+    }
+    batches = pack_variable_batches(changes, max_bytes=400)
+    assert len(batches) > 1
+    assert list(batches[0]) == ["variableCollections", "variables"]
+    assert sum(len(b.get("variables", [])) for b in batches) == 48
+    for batch in batches:
+        assert len(json.dumps(batch, separators=(",", ":"))) <= 400
+    replace_temp_ids(batches[1], {"tmp:1": "C:9"})
+    assert batches[1]["variables"][0]["variableCollectionId"] == "C:9"
+
+
+def test_sync_variables_remaps_temp_ids_within_the_size_limit(figma, payload):
+    posted = []
+
+    def handler(method, path, params, body):
+        if method == "GET":
+            return payload
+        posted.append(json.dumps(body, separators=(",", ":")))
+        created = [
+            action["id"]
+            for actions in body.values()
+            for action in actions
+            if action.get("action") == "CREATE"
+        ]
+        mapping = {
+            temp_id: f"VariableID:{'f' * 40}:{temp_id[4:]}" for temp_id in created
+        }
+        return {"meta": {"tempIdToRealId": mapping}}
+
+    desired = {
+        "Sizes": {
+            "modes": ["Default"],
+            "variables": {
+                f"size/{index}": {"resolvedType": "FLOAT", "values": {"Default": index}}
+                for index in range(20)
+            },
+        }
+    }
+    result = figma(handler).sync_variables("FILE", desired, max_request_bytes=600)
+    assert result["requests"] == len(posted) > 2
+    assert len(result["tempIdToRealId"]) == 21
+    created_before = set()
+    for body in posted:
+        assert len(body) <= 600
+        batch = json.loads(body)
+        created_here = {
+            action["id"]
+            for actions in batch.values()
+            for action in actions
+            if action.get("action") == "CREATE"
+        }
+        referenced = {
+            action[key]
+            for actions in batch.values()
+            for action in actions
+            for key in ("variableCollectionId", "variableId", "modeId")
+            if key in action
+        }
+        assert not referenced & created_before
+        created_before |= created_here
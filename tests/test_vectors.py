@@ -0,0 +1,131 @@
+from array import array
+
+import pytest
+
+from universal_mcp_figma.vectors import (
+    format_path,
+    iter_node_paths,
+    multiply,
+    node_to_svg,
+    parse_path,
+    to_matrix,
+    transform,
+)
+
+
+def test_parse_and_format_round_trip():
+    commands, coordinates = parse_path("M0 0L10 0 10 10C1 2 3 4 5 6Z")
+    assert commands == [("M", 2), ("L", 2), ("L", 2), ("C", 6), ("Z", 0)]
+    assert format_path(commands, coordinates) == "M0 0L10 0L10 10C1 2 3 4 5 6Z"
+    with pytest.raises(ValueError):
+        parse_path("Z 1 2")
+
+
+def test_transform_composes_relative_transforms():
+    parent = to_matrix([[1, 0, 10], [0, 1, 20]])
+    child = to_matrix([[0, -1, 5], [1, 0, 0]])
+    moved = transform(array("d", [1, 0, 0, 1]), multiply(parent, child))
+    assert list(moved) == [15, 21, 14, 20]
+
+
+def test_node_to_svg_places_child_paths():
+    icon = {
+        "id": "1:1",
+        "type": "FRAME",
+        "size": {"x": 24, "y": 24},
+        "children": [
+            {
+                "id": "1:2",
+                "type": "VECTOR",
+                "relativeTransform": [[1, 0, 2], [0, 1, 4]],
+                "fills": [
+                    {"type": "SOLID", "color": {"r": 1, "g": 0, "b": 0, "a": 0.5}}
+                ],
+                "fillGeometry": [
+                    {"path": "M0 0L10 0L10 10Z", "windingRule": "EVENODD"}
+                ],
+            },
+            {
+                "id": "1:3",
+                "type": "VECTOR",
+                "visible": False,
+                "fills": [{"type": "SOLID", "color": {"r": 0, "g": 0, "b": 0, "a": 1}}],
+                "fillGeometry": [{"path": "M0 0L1 1Z"}],
+            },
+        ],
+    }
+    assert node_to_svg(icon) == (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"'
+        ' viewBox="0 0 24 24" fill="none">'
+        '<path d="M2 4L12 4L12 14Z" fill="#ff0000" fill-opacity="0.5" fill-rule="evenodd"/>'
+        "</svg>"
+    )
+
+
+def rectangle(node_id, path, **props):
+    black = {"type": "SOLID", "color": {"r": 0, "g": 0, "b": 0, "a": 1}}
+    return {"id": node_id, "fills": [black], "fillGeometry": [{"path": path}], **props}
+
+
+def test_boolean_operations_paint_only_their_result():
+    subtract = rectangle(
+        "1:1",
+        "M0 0L10 0L10 10L0 10ZM3 3L3 7L7 7L7 3Z",
+        type="BOOLEAN_OPERATION",
+        children=[
+            rectangle("1:2", "M0 0L10 0L10 10L0 10Z", type="RECTANGLE"),
+            rectangle("1:3", "M3 3L7 3L7 7L3 7Z", type="RECTANGLE"),
+        ],
+    )
+    mask = rectangle("2:1", "M0 0L1 1Z", type="VECTOR", isMask=True)
+    frame = {"id": "0:1", "type": "FRAME", "children": [mask, subtract]}
+    assert [path["node_id"] for path in iter_node_paths(frame)] == ["1:1"]
+
+
+def test_export_vectors_requests_nodes_in_chunks(figma, monkeypatch):
+    from universal_mcp_figma import app as app_module
+
+    monkeypatch.setattr(app_module, "VECTOR_EXPORT_BATCH_SIZE", 2)
+    requested = []
+
+    def handler(method, path, params, body):
+        if path == "/v1/files/FILE":
+            return {"version": "3"}
+        requested.append(params["ids"])
+        return {
+            "nodes": {
+                node_id: {
+                    "document": {
+                        "id": node_id,
+                        "type": "VECTOR",
+                        "size": {"x": 1, "y": 1},
+                    }
+                }
+                for node_id in params["ids"].split(",")
+                if node_id != "9:9"
+            }
+        }
+
+    app = figma(handler)
+    exported = app.export_vectors("FILE", "1:1,1:2,1:3,9:9")
+    assert requested == ["1:1,1:2", "1:3,9:9"]
+    assert sorted(exported["svgs"]) == ["1:1", "1:2", "1:3"]
+    assert exported["not_found"] == ["9:9"]
+    app.export_vectors("FILE", "1:1,1:3")
+    assert len(requested) == 2
+
+
+def test_group_children_are_positioned_in_the_frame():
+    arrow = rectangle(
+        "2:3", "M0 0L1 1", type="VECTOR", relativeTransform=[[1, 0, 12], [0, 1, 14]]
+    )
+    group = {
+        "id": "2:2",
+        "type": "GROUP",
+        "relativeTransform": [[1, 0, 10], [0, 1, 10]],
+        "children": [arrow],
+    }
+    icon = {"id": "2:1", "type": "FRAME", "children": [group]}
+    assert [path["d"] for path in iter_node_paths(icon)] == ["M12 14L13 15"]
+    # Exported on its own, the group's origin becomes the origin of the SVG.
+    assert [path["d"] for path in iter_node_paths(group)] == ["M2 4L3 5"]
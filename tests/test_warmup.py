@@ -0,0 +1,83 @@
+import pytest
+
+from universal_mcp_figma.warmup import AccessFrequencyTable, WarmupScheduler
+
+
+def test_access_frequency_decays_and_persists(tmp_path):
+    path = str(tmp_path / "access.json")
+    table = AccessFrequencyTable(path, half_life=100)
+    for _ in range(6):
+        table.record("get_file", "old", now=0)
+    table.record("get_file", "new", now=200)
+    top = table.top(2, now=200)
+    assert [entry[1] for entry in top] == ["old", "new"]
+    assert top[0][2] == pytest.approx(1.5)
+    table.save()
+    reloaded = AccessFrequencyTable(path, half_life=100)
+    assert reloaded.top(2, now=400) == pytest.approx(table.top(2, now=400))
+    reloaded.prune(min_score=0.3, now=400)
+    assert [entry[1] for entry in reloaded.top(2, now=400)] == ["old"]
+
+
+def test_scheduler_respects_budget_and_freshness(tmp_path):
+    table = AccessFrequencyTable(str(tmp_path / "access.json"))
+    for index, file_key in enumerate(["a", "b", "c", "d"]):
+        for _ in range(10 - index):
+            table.record("get_file", file_key)
+    fetched = []
+    scheduler = WarmupScheduler(
+        table,
+        prefetch=lambda endpoint, file_key: fetched.append(file_key),
+        needs_refresh=lambda endpoint, file_key: file_key != "a",
+        top_n=3,
+        budget=1,
+    )
+    assert scheduler.run_once() == 1
+    assert fetched == ["b"]
+    assert (tmp_path / "access.json").exists()
+
+
+def test_response_cache_only_serves_tool_calls(figma):
+    state = {"version": "1", "last_modified": "a", "instances": 2, "file_requests": 0}
+
+    def handler(method, path, params, body):
+        if path == "/v1/teams/T/components":
+            return {"meta": {"components": [{"key": "button", "name": "Button"}]}}
+        if path == "/v1/teams/T/projects":
+            return {"projects": [{"id": "P"}]}
+        if path == "/v1/projects/P/files":
+            return {
+                "files": [
+                    {
+                        "key": "F",
+                        "name": "Checkout",
+                        "last_modified": state["last_modified"],
+                    }
+                ]
+            }
+        state["file_requests"] += 1
+        instances = [
+            {"id": f"1:{index}", "type": "INSTANCE", "componentId": "10:1"}
+            for index in range(state["instances"])
+        ]
+        return {
+            "version": state["version"],
+            "components": {"10:1": {"key": "button"}},
+            "document": {
+                "children": [{"id": "0:1", "name": "Page", "children": instances}]
+            },
+        }
+
+    app = figma(handler, response_cache_ttl=60)
+    tools = {tool.__name__: tool for tool in app.list_tools()}
+    tools["get_file"]("F")
+    tools["get_file"]("F")
+    assert state["file_requests"] == 1
+
+    tools["update_component_usage"]("T")
+    state.update(version="2", last_modified="b", instances=1)
+    tools["update_component_usage"]("T")
+    assert state["file_requests"] == 3
+    assert app.find_component_usages("button")["instance_count"] == 1
+    assert [entry[:2] for entry in app.access_frequency.top(10)] == [("get_file", "F")]
+    assert app.access_frequency.top(1)[0][2] == pytest.approx(2, abs=0.01)